@@ -0,0 +1,43 @@
+"""add gene counts
+
+Revision ID: 092d0d4cfbbd
+Revises: 8de25392021b
+Create Date: 2026-10-18 18:52:09.614385
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "092d0d4cfbbd"
+down_revision: str | Sequence[str] | None = "8de25392021b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "gene_counts",
+        sa.Column("assembly", sa.String(length=20), nullable=False),
+        sa.Column("chromosome", sa.String(length=10), nullable=False),
+        sa.Column("biotype", sa.String(length=50), nullable=False),
+        sa.Column("gene_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("assembly", "chromosome", "biotype"),
+    )
+
+    # Count the genes already loaded
+    op.execute(
+        "INSERT INTO gene_counts (assembly, chromosome, biotype, gene_count) "
+        "SELECT assembly, chromosome, biotype, count(*) FROM genes "
+        "GROUP BY assembly, chromosome, biotype"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("gene_counts")
@@ -0,0 +1,35 @@
+"""add gene imports
+
+Revision ID: 3f2c2637415d
+Revises: 6f92698a8c93
+Create Date: 2026-10-18 23:41:09.218734
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f2c2637415d"
+down_revision: str | Sequence[str] | None = "6f92698a8c93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "gene_imports",
+        sa.Column("assembly", sa.String(length=20), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column("imported_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("assembly"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("gene_imports")
@@ -0,0 +1,52 @@
+"""add gene query indexes
+
+Revision ID: 46ad64b4ca52
+Revises: d4ac70df5af3
+Create Date: 2026-10-18 09:41:05.502917
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "46ad64b4ca52"
+down_revision: str | Sequence[str] | None = "d4ac70df5af3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The unique constraint's index replaces the plain ensembl index
+    op.drop_index("ix_genes_ensembl", table_name="genes")
+    op.create_unique_constraint("uq_genes_ensembl", "genes", ["ensembl"])
+
+    # chromosome is the leading column of both composite indexes below
+    op.drop_index("ix_genes_chromosome", table_name="genes")
+    op.create_index(
+        "ix_genes_chromosome_biotype_id", "genes", ["chromosome", "biotype", "id"]
+    )
+    op.create_index(
+        "ix_genes_chromosome_seq_region_start",
+        "genes",
+        ["chromosome", "seq_region_start"],
+    )
+    op.create_index("ix_genes_biotype", "genes", ["biotype"])
+    op.create_index(
+        "ix_genes_gene_symbol_lower", "genes", [sa.text("lower(gene_symbol)")]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_genes_gene_symbol_lower", table_name="genes")
+    op.drop_index("ix_genes_biotype", table_name="genes")
+    op.drop_index("ix_genes_chromosome_seq_region_start", table_name="genes")
+    op.drop_index("ix_genes_chromosome_biotype_id", table_name="genes")
+    op.create_index("ix_genes_chromosome", "genes", ["chromosome"])
+    op.drop_constraint("uq_genes_ensembl", "genes", type_="unique")
+    op.create_index("ix_genes_ensembl", "genes", ["ensembl"])
@@ -0,0 +1,29 @@
+"""drop plain gene symbol index
+
+Revision ID: 6f92698a8c93
+Revises: 8d7a674d8242
+Create Date: 2026-10-18 21:34:52.301846
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f92698a8c93"
+down_revision: str | Sequence[str] | None = "8d7a674d8242"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Exact and fuzzy symbol lookups use ix_genes_gene_symbol_lower and partial
+    # matches cannot use a btree, so this index is only write overhead
+    op.drop_index("ix_genes_gene_symbol", table_name="genes")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_genes_gene_symbol", "genes", ["gene_symbol"])
@@ -0,0 +1,38 @@
+"""cover gene projection columns
+
+Revision ID: 7d721ef6f9c9
+Revises: 979c159a23b2
+Create Date: 2026-10-18 15:03:12.448921
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d721ef6f9c9"
+down_revision: str | Sequence[str] | None = "979c159a23b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COVERED_COLUMNS = ["ensembl", "gene_symbol", "seq_region_start", "seq_region_end"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_genes_chromosome_biotype_id", table_name="genes")
+    op.create_index(
+        "ix_genes_chromosome_biotype_id",
+        "genes",
+        ["chromosome", "biotype", "id"],
+        postgresql_include=COVERED_COLUMNS,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_genes_chromosome_biotype_id", table_name="genes")
+    op.create_index(
+        "ix_genes_chromosome_biotype_id", "genes", ["chromosome", "biotype", "id"]
+    )
@@ -0,0 +1,195 @@
+"""partition genes by assembly and chromosome
+
+Revision ID: 8de25392021b
+Revises: 7d721ef6f9c9
+Create Date: 2026-10-18 17:26:40.182734
+
+"""
+
+import re
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8de25392021b"
+down_revision: str | Sequence[str] | None = "7d721ef6f9c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Assembly of the genes loaded before the column existed
+DEFAULT_ASSEMBLY = "GRCh38"
+
+COVERED_COLUMNS = ["ensembl", "gene_symbol", "seq_region_start", "seq_region_end"]
+
+GENE_COLUMNS = (
+    "id, ensembl, gene_symbol, name, biotype, chromosome, "
+    "seq_region_start, seq_region_end"
+)
+
+UNPARTITIONED_INDEXES = [
+    "ix_genes_id",
+    "ix_genes_gene_symbol",
+    "ix_genes_gene_symbol_lower",
+    "ix_genes_chromosome_biotype_id",
+    "ix_genes_chromosome_seq_region_start",
+    "ix_genes_biotype",
+]
+
+PARTITIONED_INDEXES = [
+    "ix_genes_id",
+    "ix_genes_gene_symbol",
+    "ix_genes_gene_symbol_lower",
+    "ix_genes_assembly_chromosome_biotype_id",
+    "ix_genes_assembly_chromosome_seq_region_start",
+    "ix_genes_assembly_biotype",
+]
+
+
+def partition_name(*parts: str) -> str:
+    """Partition naming as of this revision; kept here so it cannot drift"""
+    name = re.sub(r"[^a-z0-9]+", "_", "_".join(["genes", *parts]).lower())
+    return name.strip("_")[:63]
+
+
+def create_partitions(chromosomes: list[str]) -> None:
+    """Partition the default assembly's genes, one partition per chromosome"""
+    parent = partition_name(DEFAULT_ASSEMBLY)
+    op.execute(
+        f"CREATE TABLE {parent} PARTITION OF genes "
+        f"FOR VALUES IN ('{DEFAULT_ASSEMBLY}') PARTITION BY LIST (chromosome)"
+    )
+    op.execute(f"CREATE TABLE {parent}_default PARTITION OF {parent} DEFAULT")
+
+    names: dict[str, str] = {}
+    for chromosome in sorted(chromosomes):
+        name = partition_name(DEFAULT_ASSEMBLY, chromosome)
+        if name in names:
+            raise ValueError(
+                f"Chromosomes {names[name]!r} and {chromosome!r} both map to "
+                f"partition {name}"
+            )
+        names[name] = chromosome
+        op.execute(
+            sa.text(f"CREATE TABLE {name} PARTITION OF {parent} FOR VALUES IN (:value)")
+            .bindparams(value=chromosome)
+            .compile(
+                dialect=op.get_bind().dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+            .string
+        )
+
+
+def gene_columns(*extra: sa.Column) -> list[sa.Column]:
+    return [
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('genes_id_seq')"),
+            nullable=False,
+        ),
+        *extra,
+        sa.Column("ensembl", sa.String(length=50), nullable=False),
+        sa.Column("gene_symbol", sa.String(length=50), nullable=True),
+        sa.Column("name", sa.Text(), nullable=True),
+        sa.Column("biotype", sa.String(length=50), nullable=False),
+        sa.Column("chromosome", sa.String(length=10), nullable=False),
+        sa.Column("seq_region_start", sa.Integer(), nullable=False),
+        sa.Column("seq_region_end", sa.Integer(), nullable=False),
+    ]
+
+
+def detach_genes(indexes: list[str], unique_constraint: str) -> None:
+    """Move the current genes table aside, keeping its id sequence"""
+    op.rename_table("genes", "genes_old")
+    op.execute("ALTER SEQUENCE genes_id_seq OWNED BY NONE")
+    for index in indexes:
+        op.drop_index(index, table_name="genes_old")
+    op.drop_constraint(unique_constraint, "genes_old", type_="unique")
+    op.drop_constraint("genes_pkey", "genes_old", type_="primary")
+
+
+def attach_genes() -> None:
+    """Drop the old table and hand the id sequence to the new one"""
+    op.drop_table("genes_old")
+    op.execute("ALTER SEQUENCE genes_id_seq OWNED BY genes.id")
+    op.create_index("ix_genes_id", "genes", ["id"])
+    op.create_index("ix_genes_gene_symbol", "genes", ["gene_symbol"])
+    op.create_index(
+        "ix_genes_gene_symbol_lower", "genes", [sa.text("lower(gene_symbol)")]
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A table cannot be partitioned in place, so genes is rebuilt as a
+    # partitioned table and the rows copied across. Partition keys must be
+    # part of the primary key and of every unique constraint.
+    detach_genes(UNPARTITIONED_INDEXES, "uq_genes_ensembl")
+    op.create_table(
+        "genes",
+        *gene_columns(sa.Column("assembly", sa.String(length=20), nullable=False)),
+        sa.PrimaryKeyConstraint("id", "assembly", "chromosome", name="genes_pkey"),
+        sa.UniqueConstraint(
+            "assembly", "ensembl", "chromosome", name="uq_genes_assembly_ensembl"
+        ),
+        postgresql_partition_by="LIST (assembly)",
+    )
+    op.execute("CREATE TABLE genes_default PARTITION OF genes DEFAULT")
+
+    chromosomes = op.get_bind().execute(
+        sa.text("SELECT DISTINCT chromosome FROM genes_old")
+    )
+    create_partitions([c for (c,) in chromosomes])
+    op.execute(
+        f"INSERT INTO genes (assembly, {GENE_COLUMNS}) "
+        f"SELECT '{DEFAULT_ASSEMBLY}', {GENE_COLUMNS} FROM genes_old"
+    )
+
+    # Indexes on the parent are created on every partition
+    attach_genes()
+    op.create_index(
+        "ix_genes_assembly_chromosome_biotype_id",
+        "genes",
+        ["assembly", "chromosome", "biotype", "id"],
+        postgresql_include=COVERED_COLUMNS,
+    )
+    op.create_index(
+        "ix_genes_assembly_chromosome_seq_region_start",
+        "genes",
+        ["assembly", "chromosome", "seq_region_start"],
+    )
+    op.create_index("ix_genes_assembly_biotype", "genes", ["assembly", "biotype"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Only the default assembly fits the single-assembly schema
+    detach_genes(PARTITIONED_INDEXES, "uq_genes_assembly_ensembl")
+    op.create_table(
+        "genes",
+        *gene_columns(),
+        sa.PrimaryKeyConstraint("id", name="genes_pkey"),
+        sa.UniqueConstraint("ensembl", name="uq_genes_ensembl"),
+    )
+    op.execute(
+        f"INSERT INTO genes ({GENE_COLUMNS}) SELECT {GENE_COLUMNS} "
+        f"FROM genes_old WHERE assembly = '{DEFAULT_ASSEMBLY}'"
+    )
+
+    attach_genes()
+    op.create_index(
+        "ix_genes_chromosome_biotype_id",
+        "genes",
+        ["chromosome", "biotype", "id"],
+        postgresql_include=COVERED_COLUMNS,
+    )
+    op.create_index(
+        "ix_genes_chromosome_seq_region_start",
+        "genes",
+        ["chromosome", "seq_region_start"],
+    )
+    op.create_index("ix_genes_biotype", "genes", ["biotype"])
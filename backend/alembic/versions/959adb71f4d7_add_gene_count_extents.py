@@ -0,0 +1,51 @@
+"""add gene count extents
+
+Revision ID: 959adb71f4d7
+Revises: 3f2c2637415d
+Create Date: 2026-10-19 09:12:44.507361
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "959adb71f4d7"
+down_revision: str | Sequence[str] | None = "3f2c2637415d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "gene_counts", sa.Column("min_seq_region_start", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "gene_counts", sa.Column("max_seq_region_end", sa.Integer(), nullable=True)
+    )
+
+    # Fill in the extents of the existing counters; counters whose genes are
+    # gone are stale and dropped, so counts fall back until the next import
+    op.execute(
+        "UPDATE gene_counts AS c "
+        "SET min_seq_region_start = g.min_start, max_seq_region_end = g.max_end "
+        "FROM (SELECT assembly, chromosome, biotype, "
+        "min(seq_region_start) AS min_start, max(seq_region_end) AS max_end "
+        "FROM genes GROUP BY assembly, chromosome, biotype) AS g "
+        "WHERE c.assembly = g.assembly AND c.chromosome = g.chromosome "
+        "AND c.biotype = g.biotype"
+    )
+    op.execute("DELETE FROM gene_counts WHERE min_seq_region_start IS NULL")
+
+    op.alter_column("gene_counts", "min_seq_region_start", nullable=False)
+    op.alter_column("gene_counts", "max_seq_region_end", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("gene_counts", "max_seq_region_end")
+    op.drop_column("gene_counts", "min_seq_region_start")
@@ -0,0 +1,52 @@
+"""add gene dictionaries
+
+Revision ID: 979c159a23b2
+Revises: 46ad64b4ca52
+Create Date: 2026-10-18 14:27:51.730264
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "979c159a23b2"
+down_revision: str | Sequence[str] | None = "46ad64b4ca52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "chromosomes",
+        sa.Column("id", sa.SmallInteger(), nullable=False),
+        sa.Column("name", sa.String(length=10), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "biotypes",
+        sa.Column("id", sa.SmallInteger(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+
+    # Assign codes to the values already loaded
+    op.execute(
+        "INSERT INTO chromosomes (name) "
+        "SELECT DISTINCT chromosome FROM genes ORDER BY chromosome"
+    )
+    op.execute(
+        "INSERT INTO biotypes (name) SELECT DISTINCT biotype FROM genes ORDER BY biotype"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("biotypes")
+    op.drop_table("chromosomes")
@@ -0,0 +1,48 @@
+"""create genes table
+
+Revision ID: d4ac70df5af3
+Revises:
+Create Date: 2026-10-18 09:12:40.118423
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4ac70df5af3"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "genes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ensembl", sa.String(length=50), nullable=False),
+        sa.Column("gene_symbol", sa.String(length=50), nullable=True),
+        sa.Column("name", sa.Text(), nullable=True),
+        sa.Column("biotype", sa.String(length=50), nullable=False),
+        sa.Column("chromosome", sa.String(length=10), nullable=False),
+        sa.Column("seq_region_start", sa.Integer(), nullable=False),
+        sa.Column("seq_region_end", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_genes_id", "genes", ["id"])
+    op.create_index("ix_genes_ensembl", "genes", ["ensembl"])
+    op.create_index("ix_genes_gene_symbol", "genes", ["gene_symbol"])
+    op.create_index("ix_genes_chromosome", "genes", ["chromosome"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_genes_chromosome", table_name="genes")
+    op.drop_index("ix_genes_gene_symbol", table_name="genes")
+    op.drop_index("ix_genes_ensembl", table_name="genes")
+    op.drop_index("ix_genes_id", table_name="genes")
+    op.drop_table("genes")
@@ -1,24 +1,139 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import case, func, orm, select, tuple_, union_all
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.models.gene import Gene
+from app.core.cache import stats_cache
+from app.core.config import settings
+from app.core.counts import count_facets, count_genes
+from app.core.database import get_read_db
+from app.core.dictionaries import encode_genes
+from app.core.fuzzy import MAX_DISTANCE, get_symbol_index
+from app.core.generations import get_import_generation
+from app.core.singleflight import coalesce
+from app.core.warmup import register_warmup
+from app.models.gene import Gene, GeneCount
+from app.schemas.gene import EncodedGeneList, GeneDetail, GeneFacets
 from app.schemas.gene import Gene as GeneSchema
 
 router = APIRouter()
 
+GeneList = list[GeneSchema] | EncodedGeneList
+
+gene_list_adapter: TypeAdapter[GeneList] = TypeAdapter(GeneList)
+
+Encoding = Literal["plain", "dictionary"]
+
+ENCODING_QUERY = Query(
+    "plain",
+    description="'dictionary' sends chromosome and biotype as integer codes "
+    "plus a dictionary mapping codes to values",
+)
+
+EXACT_COUNT_QUERY = Query(
+    False,
+    description="Count with COUNT(*) instead of import-time counters or "
+    "planner estimates",
+)
+
+# Every filtered route is scoped to one assembly, which on PostgreSQL prunes
+# the query to that assembly's partitions
+ASSEMBLY_QUERY = Query(
+    settings.DEFAULT_ASSEMBLY, min_length=1, description="Genome assembly"
+)
+
+FIELDS_QUERY = Query(
+    None,
+    description="Comma-separated gene fields to return, e.g. "
+    "'ensembl,gene_symbol,seq_region_start,seq_region_end'; only these "
+    "columns are selected from the database",
+)
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """Validate a comma-separated field list, keeping the requested order"""
+    if fields is None:
+        return None
+
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    if not requested:
+        raise HTTPException(status_code=400, detail="Fields cannot be empty")
+
+    unknown = [f for f in requested if f not in GeneSchema.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return requested
+
+
+def query_genes(db: Session, fields: list[str] | None) -> Any:
+    """Start a gene query selecting full rows or only the requested columns"""
+    if fields is None:
+        return db.query(Gene)
+    return db.query(*(getattr(Gene, field) for field in fields))
+
+
+def render_genes(
+    db: Session, genes: list[Any], encoding: Encoding, fields: list[str] | None
+) -> Any:
+    """Render a gene list in the requested encoding and projection"""
+    if fields is None and encoding == "plain":
+        return genes
+
+    if fields is None:
+        rows = [GeneSchema.model_validate(gene).model_dump() for gene in genes]
+    else:
+        rows = [gene._asdict() for gene in genes]
+
+    if encoding == "dictionary":
+        try:
+            body: Any = encode_genes(db, rows)
+        except LookupError as e:
+            # Genes loaded without the importer have no codes yet
+            raise HTTPException(status_code=503, detail=str(e)) from e
+    else:
+        body = rows
+    if fields is not None:
+        # Trimmed rows do not match the full response model
+        return JSONResponse(body)
+    return body
+
+
+def with_headers(result: Any, headers: dict[str, str]) -> Response:
+    """Attach headers to a rendered gene list"""
+    if not isinstance(result, Response):
+        value = gene_list_adapter.validate_python(result, from_attributes=True)
+        result = Response(
+            gene_list_adapter.dump_json(value), media_type="application/json"
+        )
+    result.headers.update(headers)
+    return result
+
 
-@router.get("/", response_model=list[GeneSchema])
+@router.get("/", response_model=GeneList)
+@coalesce(GeneList)
 def get_genes(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     chromosome: str | None = Query(None, description="Filter by chromosome"),
     biotype: str | None = Query(None, description="Filter by biotype"),
-    db: Session = Depends(get_db),
+    assembly: str = ASSEMBLY_QUERY,
+    encoding: Encoding = ENCODING_QUERY,
+    fields: str | None = FIELDS_QUERY,
+    count: bool = Query(
+        False, description="Send the number of matching genes in X-Total-Count"
+    ),
+    exact: bool = EXACT_COUNT_QUERY,
+    db: Session = Depends(get_read_db),
 ):
     """Get genes with pagination and optional filtering"""
     try:
-        query = db.query(Gene)
+        columns = parse_fields(fields)
+        query = query_genes(db, columns).filter(Gene.assembly == assembly)
 
         if chromosome:
             query = query.filter(Gene.chromosome == chromosome)
@@ -27,13 +142,24 @@ def get_genes(
             query = query.filter(Gene.biotype == biotype)
 
         genes = query.offset(skip).limit(limit).all()
-        return genes
+        result = render_genes(db, genes, encoding, columns)
+
+        if count:
+            total, source = count_genes(db, assembly, chromosome, biotype, exact)
+            result = with_headers(
+                result,
+                {"X-Total-Count": str(total), "X-Total-Count-Source": source},
+            )
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
 
 
 @router.get("/{gene_id}", response_model=GeneSchema)
-def get_gene(gene_id: int, db: Session = Depends(get_db)):
+@coalesce(GeneSchema)
+def get_gene(gene_id: int, db: Session = Depends(get_read_db)):
     """Get a specific gene by ID"""
     try:
         gene = db.query(Gene).filter(Gene.id == gene_id).first()
@@ -46,26 +172,206 @@ def get_gene(gene_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
 
 
-@router.get("/search/symbol/{symbol}", response_model=list[GeneSchema])
+def compute_chromosome_summaries(
+    db: Session, assembly: str, chromosome: str | None = None
+) -> dict[str, dict[str, Any]]:
+    """Aggregate gene counts, extent and biotype counts per chromosome.
+
+    The aggregates are read from the importer's counters, a handful of rows
+    per chromosome. Assemblies without counters are grouped from their genes.
+    """
+    counters: orm.Query[Any] = db.query(
+        GeneCount.chromosome,
+        GeneCount.biotype,
+        GeneCount.gene_count,
+        GeneCount.min_seq_region_start,
+        GeneCount.max_seq_region_end,
+    ).filter(GeneCount.assembly == assembly)
+    if chromosome is not None:
+        counters = counters.filter(GeneCount.chromosome == chromosome)
+    rows = counters.all()
+
+    if not rows:
+        query: orm.Query[Any] = (
+            db.query(
+                Gene.chromosome,
+                Gene.biotype,
+                func.count(Gene.id),
+                func.min(Gene.seq_region_start),
+                func.max(Gene.seq_region_end),
+            )
+            .filter(Gene.assembly == assembly)
+            .group_by(Gene.chromosome, Gene.biotype)
+        )
+        if chromosome is not None:
+            query = query.filter(Gene.chromosome == chromosome)
+        rows = query.all()
+
+    summaries: dict[str, dict[str, Any]] = {}
+    for chrom, biotype, count, start, end in rows:
+        summary = summaries.setdefault(
+            chrom,
+            {
+                "chromosome": chrom,
+                "gene_count": 0,
+                "seq_region_start": start,
+                "seq_region_end": end,
+                "biotypes": {},
+            },
+        )
+        summary["gene_count"] += count
+        summary["seq_region_start"] = min(summary["seq_region_start"], start)
+        summary["seq_region_end"] = max(summary["seq_region_end"], end)
+        summary["biotypes"][biotype] = count
+
+    return summaries
+
+
+def get_chromosome_summary(
+    db: Session, assembly: str, chromosome: str
+) -> dict[str, Any]:
+    """Get one chromosome's aggregates, served from the stats cache when warm"""
+    return stats_cache.get_or_set(
+        ("chromosome", assembly, chromosome, get_import_generation(db, assembly)),
+        lambda: compute_chromosome_summaries(db, assembly, chromosome)[chromosome],
+    )
+
+
+def get_assemblies(db: Session) -> list[str]:
+    """List the assemblies that have genes loaded"""
+    return [assembly for (assembly,) in db.query(Gene.assembly).distinct()]
+
+
+def warm_chromosome_summaries(db: Session) -> None:
+    """Precompute every chromosome's aggregates, one grouped query per assembly"""
+    for assembly in get_assemblies(db):
+        generation = get_import_generation(db, assembly)
+        summaries = compute_chromosome_summaries(db, assembly)
+        for chromosome, summary in summaries.items():
+            stats_cache.set(("chromosome", assembly, chromosome, generation), summary)
+
+
+register_warmup(warm_chromosome_summaries)
+
+
+@router.get("/{gene_id}/detail", response_model=GeneDetail)
+@coalesce(GeneDetail)
+def get_gene_detail(
+    gene_id: int,
+    flank: int = Query(
+        5, ge=0, le=50, description="Number of neighboring genes on each side"
+    ),
+    db: Session = Depends(get_read_db),
+):
+    """Get a gene with its flanking genes and chromosome-level context.
+
+    The gene and its neighbors take one statement. The chromosome summary
+    comes from the stats cache when warm, otherwise from the importer's
+    counters for the chromosome; only assemblies loaded without the importer
+    group the chromosome's genes.
+    """
+    try:
+        # The gene and its neighbors come back in one statement; neighbors are
+        # ordered by (seq_region_start, id) and served by the
+        # (assembly, chromosome, seq_region_start) index.
+        target = (
+            select(Gene.id, Gene.assembly, Gene.chromosome, Gene.seq_region_start)
+            .where(Gene.id == gene_id)
+            .cte("target")
+        )
+        position = tuple_(Gene.seq_region_start, Gene.id)
+        target_position = tuple_(target.c.seq_region_start, target.c.id)
+        same_chromosome = (Gene.assembly == target.c.assembly) & (
+            Gene.chromosome == target.c.chromosome
+        )
+        upstream_ids = (
+            select(Gene.id)
+            .join(target, same_chromosome)
+            .where(position < target_position)
+            .order_by(Gene.seq_region_start.desc(), Gene.id.desc())
+            .limit(flank)
+            .subquery()
+        )
+        downstream_ids = (
+            select(Gene.id)
+            .join(target, same_chromosome)
+            .where(position > target_position)
+            .order_by(Gene.seq_region_start, Gene.id)
+            .limit(flank)
+            .subquery()
+        )
+        ids = union_all(
+            select(target.c.id),
+            select(upstream_ids.c.id),
+            select(downstream_ids.c.id),
+        )
+
+        genes = (
+            db.query(Gene)
+            .filter(Gene.id.in_(ids))
+            .order_by(Gene.seq_region_start, Gene.id)
+            .all()
+        )
+        index = next((i for i, g in enumerate(genes) if g.id == gene_id), None)
+        if index is None:
+            raise HTTPException(status_code=404, detail="Gene not found")
+        gene = genes[index]
+
+        return {
+            "gene": gene,
+            "upstream": genes[:index],
+            "downstream": genes[index + 1 :],
+            "chromosome": get_chromosome_summary(db, gene.assembly, gene.chromosome),
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
+
+
+@router.get("/search/symbol/{symbol}", response_model=GeneList)
+@coalesce(GeneList)
 def search_genes_by_symbol(
     symbol: str,
-    exact: bool = Query(False, description="Exact match instead of partial"),
-    db: Session = Depends(get_db),
+    exact: bool = Query(
+        False, description="Exact match, ignoring case, instead of partial"
+    ),
+    fuzzy: bool = Query(
+        False, description="Typo-tolerant match, ranked by edit distance"
+    ),
+    max_distance: int = Query(
+        2, ge=1, le=MAX_DISTANCE, description="Maximum edits for fuzzy matches"
+    ),
+    assembly: str = ASSEMBLY_QUERY,
+    encoding: Encoding = ENCODING_QUERY,
+    fields: str | None = FIELDS_QUERY,
+    db: Session = Depends(get_read_db),
 ):
     """Search genes by symbol"""
     try:
         if not symbol.strip():
             raise HTTPException(status_code=400, detail="Symbol cannot be empty")
 
-        query = db.query(Gene)
+        columns = parse_fields(fields)
+        query = query_genes(db, columns).filter(Gene.assembly == assembly)
 
-        if exact:
-            query = query.filter(Gene.gene_symbol == symbol)
+        if fuzzy:
+            matches = get_symbol_index(db).search(symbol.strip().lower(), max_distance)
+            if not matches:
+                return render_genes(db, [], encoding, columns)
+            distances = {match: distance for distance, match in matches}
+            lowered = func.lower(Gene.gene_symbol)
+            query = query.filter(lowered.in_(distances)).order_by(
+                case(distances, value=lowered), lowered
+            )
+        elif exact:
+            # Case-insensitive, served by the lower(gene_symbol) index
+            query = query.filter(func.lower(Gene.gene_symbol) == symbol.lower())
         else:
             query = query.filter(Gene.gene_symbol.ilike(f"%{symbol}%"))
 
         genes = query.all()
-        return genes
+        return render_genes(db, genes, encoding, columns)
     except HTTPException:
         raise
     except Exception as e:
@@ -73,13 +379,22 @@ def search_genes_by_symbol(
 
 
 @router.get("/search/ensembl/{ensembl_id}", response_model=GeneSchema)
-def get_gene_by_ensembl(ensembl_id: str, db: Session = Depends(get_db)):
+@coalesce(GeneSchema)
+def get_gene_by_ensembl(
+    ensembl_id: str,
+    assembly: str = ASSEMBLY_QUERY,
+    db: Session = Depends(get_read_db),
+):
     """Get gene by Ensembl ID"""
     try:
         if not ensembl_id.strip():
             raise HTTPException(status_code=400, detail="Ensembl ID cannot be empty")
 
-        gene = db.query(Gene).filter(Gene.ensembl == ensembl_id).first()
+        gene = (
+            db.query(Gene)
+            .filter(Gene.assembly == assembly, Gene.ensembl == ensembl_id)
+            .first()
+        )
         if gene is None:
             raise HTTPException(status_code=404, detail="Gene not found")
         return gene
@@ -89,18 +404,23 @@ def get_gene_by_ensembl(ensembl_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
 
 
-@router.get("/search/name/{name}", response_model=list[GeneSchema])
+@router.get("/search/name/{name}", response_model=GeneList)
+@coalesce(GeneList)
 def search_genes_by_name(
     name: str,
     exact: bool = Query(False, description="Exact match instead of partial"),
-    db: Session = Depends(get_db),
+    assembly: str = ASSEMBLY_QUERY,
+    encoding: Encoding = ENCODING_QUERY,
+    fields: str | None = FIELDS_QUERY,
+    db: Session = Depends(get_read_db),
 ):
     """Search genes by name"""
     try:
         if not name.strip():
             raise HTTPException(status_code=400, detail="Name cannot be empty")
 
-        query = db.query(Gene)
+        columns = parse_fields(fields)
+        query = query_genes(db, columns).filter(Gene.assembly == assembly)
 
         if exact:
             query = query.filter(Gene.name == name)
@@ -108,40 +428,85 @@ def search_genes_by_name(
             query = query.filter(Gene.name.ilike(f"%{name}%"))
 
         genes = query.all()
-        return genes
+        return render_genes(db, genes, encoding, columns)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
 
 
+def compute_gene_stats(db: Session, assembly: str) -> dict[str, Any]:
+    """Compute the gene statistics summary for one assembly"""
+    genes = db.query(Gene).filter(Gene.assembly == assembly)
+    total_genes = genes.count()
+
+    if total_genes == 0:
+        return {
+            "total_genes": 0,
+            "chromosomes": [],
+            "biotypes": [],
+        }
+
+    # Get unique chromosomes
+    chromosomes = (
+        genes.with_entities(Gene.chromosome).distinct().order_by(Gene.chromosome)
+    )
+    chromosome_list = [chr[0] for chr in chromosomes]
+
+    # Get unique biotypes
+    biotypes = genes.with_entities(Gene.biotype).distinct().order_by(Gene.biotype)
+    biotype_list = [bt[0] for bt in biotypes]
+
+    return {
+        "total_genes": total_genes,
+        "chromosomes": chromosome_list,
+        "biotypes": biotype_list,
+    }
+
+
+def warm_gene_stats(db: Session) -> None:
+    """Precompute the statistics summary of every loaded assembly"""
+    for assembly in get_assemblies(db):
+        stats_cache.set(
+            ("summary", assembly, get_import_generation(db, assembly)),
+            compute_gene_stats(db, assembly),
+        )
+
+
+register_warmup(warm_gene_stats)
+
+
 @router.get("/stats/summary")
-def get_gene_stats(db: Session = Depends(get_db)):
+@coalesce()
+def get_gene_stats(assembly: str = ASSEMBLY_QUERY, db: Session = Depends(get_read_db)):
     """Get gene statistics summary"""
     try:
-        total_genes = db.query(Gene).count()
-
-        if total_genes == 0:
-            return {
-                "total_genes": 0,
-                "chromosomes": [],
-                "biotypes": [],
-            }
-
-        # Get unique chromosomes
-        chromosomes = (
-            db.query(Gene.chromosome).distinct().order_by(Gene.chromosome).all()
+        return stats_cache.get_or_set(
+            ("summary", assembly, get_import_generation(db, assembly)),
+            lambda: compute_gene_stats(db, assembly),
         )
-        chromosome_list = [chr[0] for chr in chromosomes]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
 
-        # Get unique biotypes
-        biotypes = db.query(Gene.biotype).distinct().order_by(Gene.biotype).all()
-        biotype_list = [bt[0] for bt in biotypes]
 
-        return {
-            "total_genes": total_genes,
-            "chromosomes": chromosome_list,
-            "biotypes": biotype_list,
-        }
+@router.get("/stats/facets", response_model=GeneFacets)
+@coalesce(GeneFacets)
+def get_gene_facets(
+    chromosome: str | None = Query(None, description="Filter by chromosome"),
+    biotype: str | None = Query(None, description="Filter by biotype"),
+    assembly: str = ASSEMBLY_QUERY,
+    exact: bool = EXACT_COUNT_QUERY,
+    db: Session = Depends(get_read_db),
+):
+    """Get gene counts per chromosome and per biotype for a listing's filters"""
+    try:
+        facets, source = count_facets(db, assembly, chromosome, biotype, exact)
+        # The chromosome facet already applies the biotype filter
+        total_genes = sum(
+            count
+            for value, count in facets["chromosome"].items()
+            if not chromosome or value == chromosome
+        )
+        return {"total_genes": total_genes, "source": source, "facets": facets}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
@@ -0,0 +1,54 @@
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """Small thread-safe in-process cache with a fixed time-to-live.
+
+    A ``ttl`` of zero disables caching, so every lookup recomputes the value.
+    Callers key entries on the import generation (see ``app.core.generations``)
+    so that an import is picked up before the entries expire.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if self.ttl <= 0:
+            return compute()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            # Entries keyed on a superseded generation are never read again;
+            # drop expired ones so they do not pile up across imports
+            self._entries = {
+                k: entry for k, entry in self._entries.items() if entry[0] > now
+            }
+            self._entries[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache for gene statistics and other slow-changing aggregates
+stats_cache = TTLCache(settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,180 @@
+"""
+Cheap gene counts for paginated listings.
+
+An exact ``COUNT(*)`` over a large filtered set reads as many rows as the set
+holds. Counts are therefore answered, in order of preference, from:
+
+``counters``
+    The ``gene_counts`` table, rebuilt by the importer, holds one row per
+    (assembly, chromosome, biotype), with the extent of its genes. Any
+    chromosome/biotype filter is a sum over at most a few hundred of these
+    rows. Exact as of the last import.
+``estimate``
+    The PostgreSQL planner's row estimate for the filtered query (``EXPLAIN``,
+    derived from ``reltuples`` and column statistics), used when an assembly
+    has no counters, e.g. genes loaded without the importer.
+``exact``
+    A real count, when the caller asks for one or the database cannot estimate.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from sqlalchemy import Row, Select, and_, case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.gene import Gene, GeneCount
+
+CountSource = Literal["counters", "estimate", "exact"]
+
+# Columns with facet counts
+FACET_COLUMNS = ["chromosome", "biotype"]
+
+Facets = dict[str, dict[str, int]]
+
+
+def sort_facets(facets: Facets) -> Facets:
+    return {column: dict(sorted(counts.items())) for column, counts in facets.items()}
+
+
+def refresh_gene_counts(db: Session, assembly: str) -> None:
+    """Rebuild the assembly's counters from its genes"""
+    db.execute(delete(GeneCount).where(GeneCount.assembly == assembly))
+    counts: Select[str, str, str, int, int, int] = (
+        select(
+            Gene.assembly,
+            Gene.chromosome,
+            Gene.biotype,
+            func.count(),
+            func.min(Gene.seq_region_start),
+            func.max(Gene.seq_region_end),
+        )
+        .where(Gene.assembly == assembly)
+        .group_by(Gene.assembly, Gene.chromosome, Gene.biotype)
+    )
+    db.execute(
+        insert(GeneCount).from_select(
+            [
+                "assembly",
+                "chromosome",
+                "biotype",
+                "gene_count",
+                "min_seq_region_start",
+                "max_seq_region_end",
+            ],
+            counts,
+        )
+    )
+    db.commit()
+
+
+def gene_filters(model: Any, filters: dict[str, str | None]) -> list[Any]:
+    """WHERE clauses for the non-empty filters on a gene or counter model"""
+    return [
+        getattr(model, column) == value for column, value in filters.items() if value
+    ]
+
+
+def estimate_rows(db: Session, statement: Select[Any]) -> int | None:
+    """The planner's row estimate for a statement, if the database has one"""
+    connection = db.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+
+    compiled = statement.compile(dialect=connection.dialect)
+    plans = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar_one()
+    if isinstance(plans, str):
+        plans = json.loads(plans)
+    return int(plans[0]["Plan"]["Plan Rows"])
+
+
+def count_genes(
+    db: Session,
+    assembly: str,
+    chromosome: str | None = None,
+    biotype: str | None = None,
+    exact: bool = False,
+) -> tuple[int, CountSource]:
+    """Count the assembly's genes matching the filters"""
+    filters = {"chromosome": chromosome, "biotype": biotype}
+
+    if not exact:
+        # One query tells both whether the assembly has counters and their sum
+        matching = gene_filters(GeneCount, filters)
+        total = func.sum(
+            case((and_(*matching), GeneCount.gene_count), else_=0)
+            if matching
+            else GeneCount.gene_count
+        )
+        counted, rows = db.execute(
+            select(total, func.count()).where(GeneCount.assembly == assembly)
+        ).one()
+        if rows:
+            return int(counted), "counters"
+
+        statement: Select[Any] = select(Gene.id).where(
+            Gene.assembly == assembly, *gene_filters(Gene, filters)
+        )
+        estimate = estimate_rows(db, statement)
+        if estimate is not None:
+            return estimate, "estimate"
+
+    count = (
+        db.query(func.count(Gene.id))
+        .filter(Gene.assembly == assembly, *gene_filters(Gene, filters))
+        .scalar()
+    )
+    return count, "exact"
+
+
+def count_facets(
+    db: Session,
+    assembly: str,
+    chromosome: str | None = None,
+    biotype: str | None = None,
+    exact: bool = False,
+) -> tuple[Facets, CountSource]:
+    """Count genes per chromosome and per biotype.
+
+    Each facet is counted with the other facets' filters applied but not its
+    own, so a client can show how many genes every alternative value would
+    return.
+    """
+    filters = {"chromosome": chromosome, "biotype": biotype}
+
+    if not exact:
+        counters: Sequence[Row[str, str, int]] = (
+            db.query(GeneCount.chromosome, GeneCount.biotype, GeneCount.gene_count)
+            .filter(GeneCount.assembly == assembly)
+            .all()
+        )
+        if counters:
+            facets: Facets = {column: {} for column in FACET_COLUMNS}
+            for row in counters:
+                for column in FACET_COLUMNS:
+                    if any(
+                        value and getattr(row, other) != value
+                        for other, value in filters.items()
+                        if other != column
+                    ):
+                        continue
+                    counts = facets[column]
+                    value = getattr(row, column)
+                    counts[value] = counts.get(value, 0) + row.gene_count
+            return sort_facets(facets), "counters"
+
+    # Facet values have no usable planner estimate; group the genes instead
+    facets = {}
+    for column in FACET_COLUMNS:
+        gene_column = getattr(Gene, column)
+        other_filters = {k: v for k, v in filters.items() if k != column}
+        facets[column] = dict(
+            db.query(gene_column, func.count(Gene.id))
+            .filter(Gene.assembly == assembly, *gene_filters(Gene, other_filters))
+            .group_by(gene_column)
+            .all()
+        )
+    return sort_facets(facets), "exact"
@@ -1,18 +1,100 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import settings
+from app.core.replicas import ReplicaSet
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Bound to the engine by get_engine(); the engine (and the database driver it
+# loads) is created on first use rather than at import time.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
+_engine: Engine | None = None
+_replicas: ReplicaSet | None = None
+
+
+def get_engine() -> Engine:
+    """Return the application engine, creating it on first use"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(settings.DATABASE_URL)
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def create_replica_engine(url: str) -> Engine:
+    connect_args = {}
+    if make_url(url).get_backend_name() == "postgresql":
+        connect_args["connect_timeout"] = settings.REPLICA_CONNECT_TIMEOUT
+    return create_engine(url, pool_pre_ping=True, connect_args=connect_args)
+
 
-def get_db():
+def get_replicas() -> ReplicaSet:
+    """Return the configured read replicas, creating their engines on first use"""
+    global _replicas
+    if _replicas is None:
+        _replicas = ReplicaSet(
+            [create_replica_engine(url) for url in settings.replica_urls],
+            settings.REPLICA_CHECK_SECONDS,
+        )
+    return _replicas
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections, if the engines have been created"""
+    if _engine is not None:
+        _engine.dispose()
+    if _replicas is not None:
+        for engine in _replicas.engines:
+            engine.dispose()
+
+
+def get_db() -> Iterator[Session]:
+    get_engine()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+class ReadSession(Session):
+    """Read-only session that moves to the primary when its replica drops.
+
+    The replica's engine marks it down on the disconnect; the failed
+    statement is then run again on the primary. Statements issued directly on
+    ``connection()`` are not retried.
+    """
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return super().execute(*args, **kwargs)
+        except DBAPIError as e:
+            primary = get_engine()
+            if not e.connection_invalidated or self.bind is primary:
+                raise
+            self.rollback()
+            self.bind = primary
+            return super().execute(*args, **kwargs)
+
+
+ReadSessionLocal = sessionmaker(class_=ReadSession, autocommit=False, autoflush=False)
+
+
+def get_read_db() -> Iterator[Session]:
+    """Session for read-only requests, on a healthy replica when configured.
+
+    Writes (the importer, dictionary and counter refreshes) always use the
+    primary through ``SessionLocal``.
+    """
+    engine = get_replicas().choose() or get_engine()
+    db = ReadSessionLocal(bind=engine)
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,102 @@
+"""
+Dictionary encoding of gene list responses.
+
+``chromosome`` and ``biotype`` take only a few dozen to a few hundred distinct
+values across all genes. Each value is given a small integer code in the
+``chromosomes`` / ``biotypes`` lookup tables so that list responses can send
+the code per gene plus one small dictionary, instead of repeating the string
+on every row.
+
+This is an encoding of responses only: the genes table keeps the strings.
+They are the partition keys and lead every index and filter, and at a few
+bytes per value (chromosomes are mostly 1-2 characters) codes would save
+little on disk.
+
+Codes are assigned by the importer and the migration that created the lookup
+tables, never on a read request. A value without a code is reported as such.
+"""
+
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import stats_cache
+from app.core.generations import get_import_generations
+from app.core.warmup import register_warmup
+from app.models.gene import Biotype, Chromosome, Gene
+
+# Encoded gene column -> lookup table holding its codes
+DICTIONARY_MODELS: dict[str, type[Chromosome] | type[Biotype]] = {
+    "chromosome": Chromosome,
+    "biotype": Biotype,
+}
+
+Dictionaries = dict[str, dict[str, int]]
+
+
+def refresh_dictionaries(db: Session) -> None:
+    """Assign codes to gene column values that do not have one yet"""
+    for column, model in DICTIONARY_MODELS.items():
+        gene_column = getattr(Gene, column)
+        missing = (
+            select(gene_column)
+            .distinct()
+            .where(gene_column.not_in(select(model.name)))
+            .order_by(gene_column)
+        )
+        db.execute(insert(model).from_select(["name"], missing))
+    db.commit()
+
+
+def load_dictionaries(db: Session) -> Dictionaries:
+    """Load the value -> code mapping of every dictionary-encoded column"""
+    return {
+        column: dict(db.query(model.name, model.id).all())
+        for column, model in DICTIONARY_MODELS.items()
+    }
+
+
+def get_dictionaries(db: Session) -> Dictionaries:
+    """Get the dictionaries, served from the stats cache when warm"""
+    return stats_cache.get_or_set(
+        ("dictionaries", get_import_generations(db)), lambda: load_dictionaries(db)
+    )
+
+
+register_warmup(get_dictionaries)
+
+
+def encode_genes(db: Session, genes: list[dict[str, Any]]) -> dict[str, Any]:
+    """Replace dictionary-encoded columns by their codes.
+
+    The response carries only the dictionary entries used by these genes;
+    codes are stable, so clients can merge dictionaries across pages. Columns
+    missing from the genes (projected away) are left out.
+    """
+    columns = [c for c in DICTIONARY_MODELS if not genes or c in genes[0]]
+    dictionaries = get_dictionaries(db)
+    if any(
+        gene[column] not in dictionaries[column] for gene in genes for column in columns
+    ):
+        # Values imported since the generations were last checked
+        dictionaries = load_dictionaries(db)
+        stats_cache.set(("dictionaries", get_import_generations(db)), dictionaries)
+
+    used: dict[str, dict[int, str]] = {column: {} for column in columns}
+    encoded = []
+    for gene in genes:
+        gene = dict(gene)
+        for column in columns:
+            value = gene[column]
+            if value not in dictionaries[column]:
+                raise LookupError(
+                    f"No dictionary code for {column} {value!r}; codes are "
+                    "assigned by the importer, re-run it for these genes"
+                )
+            code = dictionaries[column][value]
+            used[column][code] = value
+            gene[column] = code
+        encoded.append(gene)
+
+    return {"dictionaries": used, "genes": encoded}
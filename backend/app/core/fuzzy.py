@@ -0,0 +1,179 @@
+"""
+Typo-tolerant gene symbol lookup backed by a SymSpell deletion index.
+
+Every indexed symbol is stored under all strings obtained by deleting up to
+``MAX_DISTANCE`` characters from it. A query generates its own deletes the same
+way; any symbol within ``MAX_DISTANCE`` edits shares at least one delete with
+it, so candidates are found with a handful of dictionary lookups and only those
+candidates are checked with an exact edit distance.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.generations import ImportGenerations, get_import_generations
+from app.core.warmup import register_warmup
+from app.models.gene import Gene
+
+# Largest edit distance the index answers; also bounds the index size
+MAX_DISTANCE = 2
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance: Levenshtein plus adjacent transpositions"""
+    if a == b:
+        return 0
+    if not a or not b:
+        return len(a) or len(b)
+
+    before_previous: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before_previous[j - 2] + 1)
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+def deletes(word: str, max_distance: int) -> set[str]:
+    """All strings obtained by deleting up to max_distance characters"""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+class SymSpellIndex:
+    """Deletion index answering "all words within n edits" queries"""
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._words: list[str] = []
+        # Length of the longest word; longer queries cannot match
+        self.max_length = 0
+        self._word_ids: dict[str, int] = {}
+        # delete -> word id, or list of word ids when shared
+        self._deletes: dict[str, int | list[int]] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def add(self, word: str) -> None:
+        if word in self._word_ids:
+            return
+        word_id = len(self._words)
+        self._words.append(word)
+        self._word_ids[word] = word_id
+        self.max_length = max(self.max_length, len(word))
+
+        for delete in deletes(word, self.max_distance):
+            entry = self._deletes.get(delete)
+            if entry is None:
+                self._deletes[delete] = word_id
+            elif isinstance(entry, int):
+                self._deletes[delete] = [entry, word_id]
+            else:
+                entry.append(word_id)
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """Return (distance, word) pairs within max_distance, closest first"""
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"Index answers distances up to {self.max_distance}, got {max_distance}"
+            )
+        # A query has len(word) ** max_distance deletes; skip the ones that
+        # are too long to be within reach of any word
+        if len(word) > self.max_length + max_distance:
+            return []
+
+        candidates: set[int] = set()
+        for delete in deletes(word, max_distance):
+            entry = self._deletes.get(delete)
+            if entry is None:
+                continue
+            if isinstance(entry, int):
+                candidates.add(entry)
+            else:
+                candidates.update(entry)
+
+        matches = []
+        for word_id in candidates:
+            candidate = self._words[word_id]
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            distance = edit_distance(word, candidate)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+
+        matches.sort()
+        return matches
+
+
+# Guards the index globals below; held only to read or swap them
+_lock = threading.Lock()
+# Held while building a replacement, so only one request builds at a time
+_build_lock = threading.Lock()
+_symbol_index: SymSpellIndex | None = None
+_symbol_index_generations: ImportGenerations | None = None
+
+
+def build_symbol_index(db: Session) -> SymSpellIndex:
+    """Index the distinct lower-cased gene symbols"""
+    symbols = (
+        db.query(func.lower(Gene.gene_symbol))
+        .filter(Gene.gene_symbol.is_not(None))
+        .distinct()
+    )
+    return SymSpellIndex(symbol for (symbol,) in symbols)
+
+
+def get_symbol_index(db: Session) -> SymSpellIndex:
+    """Get the index of lower-cased gene symbols, rebuilding it after an import.
+
+    Import generations are compared at most every IMPORT_CHECK_SECONDS.
+    A stale index keeps answering other requests while one request builds its
+    replacement; only the very first build makes requests wait.
+    """
+    global _symbol_index, _symbol_index_generations
+
+    generations = get_import_generations(db)
+    with _lock:
+        index = _symbol_index
+        if index is not None and _symbol_index_generations == generations:
+            return index
+
+    if index is None:
+        _build_lock.acquire()
+    elif not _build_lock.acquire(blocking=False):
+        # Another request is building the replacement
+        return index
+
+    try:
+        with _lock:
+            if _symbol_index is not None and _symbol_index_generations == generations:
+                return _symbol_index
+        replacement = build_symbol_index(db)
+        with _lock:
+            _symbol_index = replacement
+            _symbol_index_generations = generations
+        return replacement
+    finally:
+        _build_lock.release()
+
+
+register_warmup(get_symbol_index)
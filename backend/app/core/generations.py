@@ -0,0 +1,58 @@
+"""
+Import generations: a counter per assembly that every completed gene import bumps.
+
+Caches derived from the genes table (statistics, chromosome summaries,
+dictionaries, the fuzzy symbol index) are keyed on these, so a finished import
+replaces them without waiting for entries to expire. The generations are read at
+most every IMPORT_CHECK_SECONDS; within that interval the last reading is served
+without touching the database.
+"""
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.models.gene import GeneImport
+
+ImportGenerations = tuple[tuple[str, int], ...]
+
+# Guards the globals below; never held while querying
+_lock = threading.Lock()
+_generations: ImportGenerations | None = None
+# Monotonic time the generations were last read
+_checked_at = float("-inf")
+
+
+def read_import_generations(db: Session) -> ImportGenerations:
+    """Read the generation of every imported assembly"""
+    rows: Query[Any] = db.query(GeneImport.assembly, GeneImport.generation).order_by(
+        GeneImport.assembly
+    )
+    return tuple((row.assembly, row.generation) for row in rows)
+
+
+def get_import_generations(db: Session) -> ImportGenerations:
+    """Get every assembly's import generation, read at most once per interval"""
+    global _generations, _checked_at
+
+    with _lock:
+        now = time.monotonic()
+        if _generations is not None and (
+            now - _checked_at < settings.IMPORT_CHECK_SECONDS
+        ):
+            return _generations
+        # Stamp first, so concurrent requests serve the last reading meanwhile
+        _checked_at = now
+
+    generations = read_import_generations(db)
+    with _lock:
+        _generations = generations
+    return generations
+
+
+def get_import_generation(db: Session, assembly: str) -> int:
+    """Get one assembly's import generation; 0 until it is first imported"""
+    return dict(get_import_generations(db)).get(assembly, 0)
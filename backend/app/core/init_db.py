@@ -1,8 +1,9 @@
-from app.core.database import Base, engine
+import app.models.gene  # noqa: F401
+from app.core.database import Base, get_engine
 
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 
 if __name__ == "__main__":
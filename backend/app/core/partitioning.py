@@ -0,0 +1,128 @@
+"""
+PostgreSQL declarative partitioning of the genes table.
+
+Migrated PostgreSQL databases store genes LIST-partitioned by assembly, and
+each assembly partition LIST-partitioned by chromosome:
+
+    genes
+    ├── genes_grch38                FOR VALUES IN ('GRCh38')
+    │   ├── genes_grch38_1          FOR VALUES IN ('1')
+    │   ├── ...
+    │   └── genes_grch38_default    DEFAULT
+    └── genes_default               DEFAULT
+
+Queries filtering on assembly (and chromosome) are pruned by the planner to the
+matching partitions. The importer creates partitions ahead of each batch, so the
+default partitions only catch rows written some other way. On SQLite, or on a
+table created with ``init_db``, these helpers do nothing.
+
+Partition names are lossy: ``GRCh38`` and ``grch38``, or chromosomes ``1.1``
+and ``1_1``, map to the same name, and long names are truncated. A name that
+already belongs to a partition with other bounds is an error rather than
+silently sending the rows to a default partition.
+"""
+
+import re
+from collections.abc import Iterable
+
+from sqlalchemy import Connection, String, bindparam, literal, text
+
+TABLE = "genes"
+
+# PostgreSQL truncates longer identifiers
+MAX_IDENTIFIER_LENGTH = 63
+
+
+def partition_name(assembly: str, chromosome: str | None = None) -> str:
+    """Name of an assembly partition, or of a chromosome partition within it"""
+    parts = [TABLE, assembly] if chromosome is None else [TABLE, assembly, chromosome]
+    name = re.sub(r"[^a-z0-9]+", "_", "_".join(parts).lower()).strip("_")
+    return name[:MAX_IDENTIFIER_LENGTH]
+
+
+def is_partitioned(connection: Connection) -> bool:
+    """Whether the genes table is a PostgreSQL partitioned table"""
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table))"
+            ),
+            {"table": TABLE},
+        ).scalar()
+    )
+
+
+def _literal(connection: Connection, value: str) -> str:
+    """Render a string literal; partition bounds cannot be bind parameters"""
+    return str(
+        literal(value, String()).compile(
+            dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def existing_partitions(
+    connection: Connection, names: Iterable[str]
+) -> dict[str, tuple[str | None, str | None]]:
+    """Parent and bound expression of each named relation that exists"""
+    rows = connection.execute(
+        text(
+            "SELECT c.relname, p.relname, pg_get_expr(c.relpartbound, c.oid) "
+            "FROM pg_class c "
+            "LEFT JOIN pg_inherits i ON i.inhrelid = c.oid "
+            "LEFT JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE c.relname IN :names AND pg_table_is_visible(c.oid)"
+        ).bindparams(bindparam("names", expanding=True)),
+        {"names": list(names)},
+    )
+    return {name: (parent, bound) for name, parent, bound in rows}
+
+
+def ensure_partitions(
+    connection: Connection, assembly: str, chromosomes: Iterable[str]
+) -> None:
+    """Create the assembly's partition and any missing chromosome partitions"""
+    if not is_partitioned(connection):
+        return
+
+    quote = connection.dialect.identifier_preparer.quote
+    parent = partition_name(assembly)
+    # name -> (parent, bound, trailing DDL)
+    partitions = {
+        parent: (
+            TABLE,
+            f"FOR VALUES IN ({_literal(connection, assembly)})",
+            " PARTITION BY LIST (chromosome)",
+        ),
+        parent + "_default": (parent, "DEFAULT", ""),
+    }
+    for chromosome in sorted(set(chromosomes)):
+        name = partition_name(assembly, chromosome)
+        bound = f"FOR VALUES IN ({_literal(connection, chromosome)})"
+        if name in partitions:
+            raise ValueError(
+                f"Partition name {name} for {bound} is also that of "
+                f"{partitions[name][1]}"
+            )
+        partitions[name] = (parent, bound, "")
+
+    existing = existing_partitions(connection, partitions)
+    for name, (parent_name, bound, suffix) in partitions.items():
+        if name in existing:
+            if existing[name] != (parent_name, bound):
+                found_parent, found_bound = existing[name]
+                raise ValueError(
+                    f"Partition name {name} for {bound} of {parent_name} is "
+                    f"taken by {found_bound or 'a table'} of "
+                    f"{found_parent or 'no parent'}"
+                )
+            continue
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {quote(name)} "
+                f"PARTITION OF {quote(parent_name)} {bound}{suffix}"
+            )
+        )
@@ -0,0 +1,90 @@
+"""
+Read-replica selection for the gene read endpoints.
+
+Reads are spread round-robin over the configured replicas. A replica is pinged
+before use once its last health check is older than the check interval; only
+the request that finds the check due pings, the others go by the last result.
+A replica that fails the ping, or whose connection drops mid-query, is skipped
+until its next check. When no replica is healthy, callers fall back to the
+primary.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Sequence
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import ExceptionContext
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Round-robin choice among the healthy engines of a set of replicas"""
+
+    def __init__(self, engines: Sequence[Engine], check_interval: float) -> None:
+        self.engines = list(engines)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next = 0
+        self._healthy = [True] * len(self.engines)
+        # Monotonic time of each replica's last health check
+        self._checked_at = [float("-inf")] * len(self.engines)
+
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect and context.engine is not None:
+            self.mark_down(self.engines.index(context.engine))
+
+    def mark_down(self, index: int) -> None:
+        """Skip a replica until its next health check"""
+        with self._lock:
+            self._healthy[index] = False
+            self._checked_at[index] = time.monotonic()
+
+    def check(self, index: int) -> bool:
+        """Ping a replica and record whether it answered"""
+        engine = self.engines[index]
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            healthy = True
+        except Exception as e:
+            logger.warning("Read replica %s is unavailable: %s", engine.url, e)
+            healthy = False
+
+        with self._lock:
+            self._healthy[index] = healthy
+            self._checked_at[index] = time.monotonic()
+        return healthy
+
+    def choose(self) -> Engine | None:
+        """Return the next healthy replica, or None when there is none"""
+        if not self.engines:
+            return None
+
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self.engines)
+
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            with self._lock:
+                due = time.monotonic() - self._checked_at[index] >= self.check_interval
+                if due:
+                    # Claim the check, so requests arriving while it runs go
+                    # by the last result instead of pinging (and waiting) too
+                    self._checked_at[index] = time.monotonic()
+                healthy = self._healthy[index]
+            if due:
+                if self.check(index):
+                    return self.engines[index]
+            elif healthy:
+                return self.engines[index]
+        return None
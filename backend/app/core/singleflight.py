@@ -0,0 +1,118 @@
+"""
+Request coalescing ("single-flight") for read handlers.
+
+When several identical requests arrive while one is already being served, the
+later ones wait for the first and share its result instead of running the same
+query and serialization again. This flattens the thundering herd of identical
+dashboard requests after a restart or an import.
+"""
+
+import functools
+import inspect
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share it"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()  # type: ignore[no-any-return]
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+flight = SingleFlight()
+
+# Parameters that identify the request's connection rather than its content
+_IGNORED_PARAMETERS = {"db"}
+
+# Headers recomputed for every response built from a shared body
+_RENDERED_HEADERS = {"content-length", "content-type"}
+
+
+def coalesce(response_model: Any = Any) -> Callable[[Callable[..., Any]], Any]:
+    """Coalesce identical concurrent calls of a route handler.
+
+    Requests are keyed on the handler and its parameters (minus the database
+    session). The leader runs the handler and serializes the result with
+    ``response_model`` once; every waiter gets a response built from the same
+    body and headers. Exceptions, including ``HTTPException``, are shared the
+    same way.
+    """
+    adapter: TypeAdapter[Any] = TypeAdapter(response_model)
+
+    def render(result: Any) -> tuple[int, bytes, str | None, dict[str, str]]:
+        if isinstance(result, Response):
+            headers = {
+                name: value
+                for name, value in result.headers.items()
+                if name not in _RENDERED_HEADERS
+            }
+            return result.status_code, bytes(result.body), result.media_type, headers
+        value = adapter.validate_python(result, from_attributes=True)
+        return 200, adapter.dump_json(value), "application/json", {}
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not settings.COALESCE_REQUESTS:
+                return func(*args, **kwargs)
+
+            arguments = signature.bind(*args, **kwargs).arguments
+            key = (
+                func.__module__,
+                func.__qualname__,
+                tuple(
+                    sorted(
+                        (name, value)
+                        for name, value in arguments.items()
+                        if name not in _IGNORED_PARAMETERS
+                    )
+                ),
+            )
+            status_code, body, media_type, headers = flight.do(
+                key, lambda: render(func(*args, **kwargs))
+            )
+            return Response(
+                content=body,
+                status_code=status_code,
+                media_type=media_type,
+                headers=headers,
+            )
+
+        return wrapper
+
+    return decorator
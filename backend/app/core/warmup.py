@@ -0,0 +1,47 @@
+"""
+Startup work that should run once per process tree.
+
+When served by gunicorn with ``preload_app`` (see ``gunicorn.conf.py``) this runs
+in the master before workers are forked, so caches and in-memory indexes built
+here are shared copy-on-write by every worker.
+"""
+
+import logging
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session, configure_mappers
+
+from app.core.database import SessionLocal, dispose_engine, get_engine
+
+logger = logging.getLogger(__name__)
+
+WarmupFunc = Callable[[Session], object]
+
+_warmups: list[WarmupFunc] = []
+
+
+def register_warmup(func: WarmupFunc) -> None:
+    """Register a function to run against the database during warm-up"""
+    _warmups.append(func)
+
+
+def warm_up() -> None:
+    """Run all registered warm-up functions"""
+    configure_mappers()
+
+    get_engine()
+    db = SessionLocal()
+    try:
+        for func in _warmups:
+            try:
+                func(db)
+            except Exception:
+                # A cold cache is not fatal; workers fill it on first use
+                logger.exception("Warm-up step %s failed", func.__name__)
+                db.rollback()
+    finally:
+        db.close()
+
+    # Never hand pooled connections to forked workers; the engine (and its
+    # compiled statement cache) survives, only the connections are dropped.
+    dispose_engine()
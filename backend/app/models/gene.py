@@ -1,16 +1,134 @@
-from sqlalchemy import Column, Integer, String, Text
+from datetime import datetime
 
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.config import settings
 from app.core.database import Base
 
+# Columns carried in the chromosome/biotype index for index-only projections
+COVERED_COLUMNS = ["ensembl", "gene_symbol", "seq_region_start", "seq_region_end"]
+
 
 class Gene(Base):
     __tablename__ = "genes"
+    # On PostgreSQL the alembic migrations build this table partitioned by
+    # assembly, then by chromosome (see app.core.partitioning). Every index
+    # leads with assembly so unpartitioned databases (SQLite, init_db) are
+    # served the same way, and the unique constraint carries the partition
+    # keys as PostgreSQL requires.
+    __table_args__ = (
+        UniqueConstraint(
+            "assembly", "ensembl", "chromosome", name="uq_genes_assembly_ensembl"
+        ),
+        # Serves chromosome and chromosome + biotype listings in id order; the
+        # included columns let narrow projections (?fields=) be index-only scans
+        Index(
+            "ix_genes_assembly_chromosome_biotype_id",
+            "assembly",
+            "chromosome",
+            "biotype",
+            "id",
+            postgresql_include=COVERED_COLUMNS,
+        ),
+        # Serves positional lookups within a chromosome
+        Index(
+            "ix_genes_assembly_chromosome_seq_region_start",
+            "assembly",
+            "chromosome",
+            "seq_region_start",
+        ),
+        Index("ix_genes_assembly_biotype", "assembly", "biotype"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    ensembl = Column(String(50), nullable=False, index=True)
-    gene_symbol = Column(String(50), nullable=True, index=True)
+    assembly = Column(
+        String(20), nullable=False, default=lambda: settings.DEFAULT_ASSEMBLY
+    )
+    ensembl = Column(String(50), nullable=False)
+    gene_symbol = Column(String(50), nullable=True)
     name = Column(Text, nullable=True)
     biotype = Column(String(50), nullable=False)
-    chromosome = Column(String(10), nullable=False, index=True)
+    chromosome = Column(String(10), nullable=False)
     seq_region_start = Column(Integer, nullable=False)
     seq_region_end = Column(Integer, nullable=False)
+
+
+# Serves case-insensitive exact and fuzzy symbol lookups; partial matches
+# (ILIKE '%...%') cannot use a btree, so there is no plain gene_symbol index
+Index("ix_genes_gene_symbol_lower", func.lower(Gene.gene_symbol))
+
+
+# Dictionaries for the low-cardinality gene columns, used to encode responses
+# (genes itself stores the strings). Codes are assigned once and never
+# renumbered, so clients can cache them across requests.
+DictionaryCode = SmallInteger().with_variant(Integer(), "sqlite")
+
+
+class Chromosome(Base):
+    __tablename__ = "chromosomes"
+
+    id = Column(DictionaryCode, primary_key=True)
+    name = Column(String(10), nullable=False, unique=True)
+
+
+class Biotype(Base):
+    __tablename__ = "biotypes"
+
+    id = Column(DictionaryCode, primary_key=True)
+    name = Column(String(50), nullable=False, unique=True)
+
+
+class GeneCount(Base):
+    """Number of genes per assembly, chromosome and biotype, rebuilt on import"""
+
+    __tablename__ = "gene_counts"
+
+    assembly = Column(String(20), primary_key=True)
+    chromosome = Column(String(10), primary_key=True)
+    biotype = Column(String(50), primary_key=True)
+    gene_count = Column(Integer, nullable=False)
+    # Extent of the group's genes, for chromosome summaries
+    min_seq_region_start = Column(Integer, nullable=False)
+    max_seq_region_end = Column(Integer, nullable=False)
+
+
+class GeneImportCheckpoint(Base):
+    """Position of the last committed batch of an unfinished gene import"""
+
+    __tablename__ = "gene_import_checkpoints"
+
+    # Typed columns: the importer does arithmetic on these in Python
+    assembly: Mapped[str] = mapped_column(String(20), primary_key=True)
+    source: Mapped[str] = mapped_column(Text)
+    source_size: Mapped[int] = mapped_column(BigInteger)
+    # Byte offset in the source just past the last committed row
+    byte_offset: Mapped[int] = mapped_column(BigInteger)
+    row_number: Mapped[int] = mapped_column(Integer)
+    imported_count: Mapped[int] = mapped_column(Integer)
+    rejected_count: Mapped[int] = mapped_column(Integer)
+    rejected_path: Mapped[str] = mapped_column(Text)
+    # Size of the rejects file when the batch was committed
+    rejected_offset: Mapped[int] = mapped_column(BigInteger)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class GeneImport(Base):
+    """Generation of each assembly's genes, bumped by every completed import"""
+
+    __tablename__ = "gene_imports"
+
+    assembly: Mapped[str] = mapped_column(String(20), primary_key=True)
+    generation: Mapped[int] = mapped_column(Integer)
+    imported_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
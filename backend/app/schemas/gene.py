@@ -1,7 +1,10 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class GeneBase(BaseModel):
+    assembly: str
     ensembl: str
     gene_symbol: str | None = None
     name: str | None = None
@@ -16,3 +19,43 @@ class Gene(GeneBase):
 
     class Config:
         from_attributes = True
+
+
+class ChromosomeSummary(BaseModel):
+    chromosome: str
+    gene_count: int
+    seq_region_start: int
+    seq_region_end: int
+    biotypes: dict[str, int]
+
+
+class GeneDetail(BaseModel):
+    gene: Gene
+    upstream: list[Gene]
+    downstream: list[Gene]
+    chromosome: ChromosomeSummary
+
+
+class EncodedGene(BaseModel):
+    """Gene with chromosome and biotype replaced by dictionary codes"""
+
+    id: int
+    assembly: str
+    ensembl: str
+    gene_symbol: str | None = None
+    name: str | None = None
+    biotype: int
+    chromosome: int
+    seq_region_start: int
+    seq_region_end: int
+
+
+class EncodedGeneList(BaseModel):
+    dictionaries: dict[str, dict[int, str]]
+    genes: list[EncodedGene]
+
+
+class GeneFacets(BaseModel):
+    total_genes: int
+    source: Literal["counters", "estimate", "exact"]
+    facets: dict[str, dict[str, int]]
@@ -1,20 +1,44 @@
 #!/usr/bin/env python3
 """
 Import gene data from CSV file to PostgreSQL database.
+
+The file is streamed and inserted in batches of plain rows, so memory use does
+not grow with the file. Each batch is committed together with a checkpoint
+recording how far into the file it reached; after a crash, ``--resume``
+continues from the last committed batch instead of starting over. Rows that
+cannot be imported are written, with the reason, to a rejects file next to the
+CSV; that includes rows the database refuses, such as duplicate genes.
 """
 
+import argparse
 import csv
+import os
 import sys
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.database import Base, SessionLocal, engine
-from app.models.gene import Gene
+from app.core.config import settings
+from app.core.counts import refresh_gene_counts
+from app.core.database import Base, SessionLocal, get_engine
+from app.core.dictionaries import refresh_dictionaries
+from app.core.partitioning import ensure_partitions
+from app.models.gene import Gene, GeneCount, GeneImport, GeneImportCheckpoint
+
+# Use semicolon as delimiter based on the CSV structure
+DELIMITER = ";"
 
+# Seconds between progress lines
+PROGRESS_INTERVAL = 5.0
 
-def clean_csv_value(value: str) -> str | None:
+
+def clean_csv_value(value: str | None) -> str | None:
     """Clean CSV value, return None for empty strings"""
     if not value or value.strip() == "":
         return None
@@ -34,75 +58,308 @@ def parse_csv_row(row: dict[str, str]) -> dict[str, Any]:
     }
 
 
-def import_genes_from_csv(csv_file_path: str, batch_size: int = 1000) -> None:
-    """Import genes from CSV file to database"""
+class LineReader:
+    """Decoded lines of a binary file, tracking the byte offset read so far.
+
+    ``csv.reader`` pulls lines from this only as it needs them, so after each
+    record ``offset`` is the position just past it, even for quoted fields
+    spanning several lines.
+    """
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self.file = file
+        self.offset = file.tell()
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = self.file.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
+
+    def seek(self, offset: int) -> None:
+        self.file.seek(offset)
+        self.offset = offset
+
+
+class Progress:
+    """Throughput and ETA of an import, printed every PROGRESS_INTERVAL seconds"""
+
+    def __init__(self, total_bytes: int, offset: int, rows: int) -> None:
+        self.total_bytes = total_bytes
+        self.start_offset = offset
+        self.start_rows = rows
+        self.started = self.reported = time.monotonic()
+
+    def report(self, offset: int, rows: int, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.reported < PROGRESS_INTERVAL:
+            return
+        self.reported = now
+
+        elapsed = max(now - self.started, 1e-9)
+        rows_per_second = (rows - self.start_rows) / elapsed
+        bytes_per_second = (offset - self.start_offset) / elapsed
+        done = offset / self.total_bytes if self.total_bytes else 1.0
+        eta: timedelta | str
+        if bytes_per_second:
+            eta = timedelta(
+                seconds=round((self.total_bytes - offset) / bytes_per_second)
+            )
+        else:
+            eta = "unknown"
+        print(
+            f"Imported {rows} genes ({done:.1%}), "
+            f"{rows_per_second:,.0f} rows/s, ETA {eta}"
+        )
+
+
+def insert_batch(
+    db: Session,
+    genes: list[dict[str, Any]],
+    assembly: str,
+    partitioned: set[str],
+) -> list[tuple[int, str]]:
+    """Insert a batch of genes, returning (position, error) of rows that failed.
+
+    The batch is inserted with one statement. If the database refuses it
+    (a duplicate gene, a value too long for its column), it is retried row by
+    row, each in its own savepoint, so that only the offending rows are left
+    out. Nothing is committed.
+    """
+    chromosomes = {gene["chromosome"] for gene in genes} - partitioned
+    if chromosomes:
+        ensure_partitions(db.connection(), assembly, chromosomes)
+        partitioned |= chromosomes
+    if not genes:
+        return []
 
-    if not Path(csv_file_path).exists():
+    try:
+        with db.begin_nested():
+            db.execute(insert(Gene), genes)
+        return []
+    except (IntegrityError, DataError):
+        pass
+
+    failed = []
+    for position, gene in enumerate(genes):
+        try:
+            with db.begin_nested():
+                db.execute(insert(Gene), [gene])
+        except (IntegrityError, DataError) as e:
+            failed.append((position, str(e.orig).splitlines()[0]))
+    return failed
+
+
+def start_import(
+    db: Session,
+    assembly: str,
+    source: Path,
+    rejected_path: Path,
+    data_offset: int,
+) -> GeneImportCheckpoint:
+    """Clear the assembly's genes and record a checkpoint at the first row"""
+    print(f"Clearing existing {assembly} gene data...")
+    db.execute(delete(Gene).where(Gene.assembly == assembly))
+    # Counters are rebuilt when the import completes; until then counts fall
+    # back to estimates rather than the previous import's totals
+    db.execute(delete(GeneCount).where(GeneCount.assembly == assembly))
+    db.execute(
+        delete(GeneImportCheckpoint).where(GeneImportCheckpoint.assembly == assembly)
+    )
+    checkpoint = GeneImportCheckpoint(
+        assembly=assembly,
+        source=str(source),
+        source_size=source.stat().st_size,
+        byte_offset=data_offset,
+        row_number=1,
+        imported_count=0,
+        rejected_count=0,
+        rejected_path=str(rejected_path),
+        rejected_offset=0,
+        updated_at=datetime.now(UTC),
+    )
+    db.add(checkpoint)
+    db.commit()
+    return checkpoint
+
+
+def finish_import(db: Session, assembly: str) -> None:
+    """Bump the generation of the assembly's genes"""
+    record = db.get(GeneImport, assembly)
+    if record is None:
+        record = GeneImport(assembly=assembly, generation=0)
+        db.add(record)
+    record.generation += 1
+    record.imported_at = datetime.now(UTC)
+
+
+def load_checkpoint(db: Session, assembly: str, source: Path) -> GeneImportCheckpoint:
+    """Find the checkpoint of the assembly's interrupted import of source"""
+    checkpoint = db.get(GeneImportCheckpoint, assembly)
+    if checkpoint is None:
+        raise RuntimeError(f"No interrupted {assembly} import to resume")
+    if (checkpoint.source, checkpoint.source_size) != (
+        str(source),
+        source.stat().st_size,
+    ):
+        raise RuntimeError(
+            f"The interrupted {assembly} import read {checkpoint.source} "
+            f"({checkpoint.source_size} bytes); it cannot be resumed from "
+            f"{source} ({source.stat().st_size} bytes)"
+        )
+    return checkpoint
+
+
+def import_genes_from_csv(
+    csv_file_path: str,
+    batch_size: int = 1000,
+    assembly: str | None = None,
+    resume: bool = False,
+    rejected_file_path: str | None = None,
+) -> None:
+    """Import genes from CSV file to database, replacing the assembly's genes"""
+    assembly = assembly or settings.DEFAULT_ASSEMBLY
+    source = Path(csv_file_path).resolve()
+
+    if not source.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
 
     # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
-    db: Session = SessionLocal()
+    # The checkpoint is updated after every commit; keep it loaded
+    db: Session = SessionLocal(expire_on_commit=False)
 
     try:
-        # Clear existing data
-        print("Clearing existing gene data...")
-        db.query(Gene).delete()
-        db.commit()
+        with open(source, "rb") as file:
+            lines = LineReader(file)
+            reader = csv.reader(lines, delimiter=DELIMITER)
+            header = next(reader)
+
+            if resume:
+                checkpoint = load_checkpoint(db, assembly, source)
+                print(
+                    f"Resuming {assembly} import after row {checkpoint.row_number} "
+                    f"(byte {checkpoint.byte_offset})..."
+                )
+                lines.seek(checkpoint.byte_offset)
+            else:
+                rejected_path = (
+                    Path(rejected_file_path).resolve()
+                    if rejected_file_path
+                    else source.with_suffix(".rejected.csv")
+                )
+                checkpoint = start_import(
+                    db, assembly, source, rejected_path, lines.offset
+                )
+
+            # Drop rejects written after the last committed batch
+            with open(checkpoint.rejected_path, "a+b") as stale_rejects:
+                stale_rejects.truncate(checkpoint.rejected_offset)
+
+            print(f"Reading CSV file: {source}")
+            print(f"Rejected rows go to: {checkpoint.rejected_path}")
+
+            with open(
+                checkpoint.rejected_path, "a", encoding="utf-8", newline=""
+            ) as rejected_file:
+                rejects = csv.writer(rejected_file, delimiter=DELIMITER)
+                if checkpoint.rejected_offset == 0:
+                    rejects.writerow(["Row", "Error", *header])
+
+                progress = Progress(
+                    checkpoint.source_size,
+                    checkpoint.byte_offset,
+                    checkpoint.imported_count,
+                )
+                genes_to_add: list[dict[str, Any]] = []
+                # Row number and fields of each gene, for rejecting it
+                rows_to_add: list[tuple[int, list[str]]] = []
+                partitioned: set[str] = set()
+
+                def commit() -> None:
+                    failed = insert_batch(db, genes_to_add, assembly, partitioned)
+                    for position, error in failed:
+                        row_number, values = rows_to_add[position]
+                        rejects.writerow([row_number, error, *values])
+                    rejected_file.flush()
+
+                    # Commit the batch together with the checkpoint past it
+                    checkpoint.byte_offset = lines.offset
+                    checkpoint.imported_count += len(genes_to_add) - len(failed)
+                    checkpoint.rejected_count += len(failed)
+                    checkpoint.rejected_offset = os.fstat(
+                        rejected_file.fileno()
+                    ).st_size
+                    checkpoint.updated_at = datetime.now(UTC)
+                    db.commit()
+
+                    genes_to_add.clear()
+                    rows_to_add.clear()
+                    progress.report(lines.offset, checkpoint.imported_count)
+
+                for values in reader:
+                    checkpoint.row_number += 1
+                    if not values:
+                        continue
 
-        print(f"Reading CSV file: {csv_file_path}")
+                    try:
+                        if len(values) != len(header):
+                            raise ValueError(
+                                f"expected {len(header)} fields, got {len(values)}"
+                            )
+                        gene_data = parse_csv_row(
+                            dict(zip(header, values, strict=True))
+                        )
+
+                        # Reject rows with missing essential data
+                        if not gene_data["ensembl"]:
+                            raise ValueError("missing Ensembl ID")
+                    except ValueError as e:
+                        rejects.writerow([checkpoint.row_number, str(e), *values])
+                        checkpoint.rejected_count += 1
+                        continue
 
-        genes_to_add = []
-        total_imported = 0
-        skipped_count = 0
+                    genes_to_add.append({"assembly": assembly, **gene_data})
+                    rows_to_add.append((checkpoint.row_number, values))
 
-        with open(csv_file_path, encoding="utf-8") as file:
-            # Use semicolon as delimiter based on the CSV structure
-            reader = csv.DictReader(file, delimiter=";")
+                    # Batch insert for performance
+                    if len(genes_to_add) >= batch_size:
+                        commit()
 
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
-                try:
-                    gene_data = parse_csv_row(row)
+                # Import remaining genes
+                commit()
+                progress.report(lines.offset, checkpoint.imported_count, force=True)
 
-                    # Skip rows with missing essential data
-                    if not gene_data["ensembl"]:
-                        skipped_count += 1
-                        continue
+        # Assign dictionary codes to any new chromosome or biotype values
+        refresh_dictionaries(db)
 
-                    gene = Gene(**gene_data)
-                    genes_to_add.append(gene)
+        # Rebuild the counters behind X-Total-Count and facet counts
+        refresh_gene_counts(db, assembly)
 
-                    # Batch insert for performance
-                    if len(genes_to_add) >= batch_size:
-                        db.add_all(genes_to_add)
-                        db.commit()
-                        total_imported += len(genes_to_add)
-                        print(f"Imported {total_imported} genes...")
-                        genes_to_add = []
-
-                except Exception as e:
-                    print(f"Error processing row {row_num}: {e}")
-                    print(f"Row data: {row}")
-                    skipped_count += 1
-                    continue
-
-        # Import remaining genes
-        if genes_to_add:
-            db.add_all(genes_to_add)
-            db.commit()
-            total_imported += len(genes_to_add)
+        # The import is complete; there is nothing left to resume. Bumping the
+        # generation tells the API to rebuild indexes over the genes.
+        db.delete(checkpoint)
+        finish_import(db, assembly)
+        db.commit()
 
         print("\n✅ Import completed!")
-        print(f"   Total imported: {total_imported} genes")
-        print(f"   Skipped: {skipped_count} rows")
+        print(f"   Total imported: {checkpoint.imported_count} genes")
+        print(f"   Rejected: {checkpoint.rejected_count} rows")
+        if checkpoint.rejected_count:
+            print(f"   Rejected rows: {checkpoint.rejected_path}")
 
         # Show some statistics
-        total_genes = db.query(Gene).count()
-        unique_chromosomes = db.query(Gene.chromosome).distinct().count()
-        unique_biotypes = db.query(Gene.biotype).distinct().count()
+        genes = db.query(Gene).filter(Gene.assembly == assembly)
+        total_genes = genes.count()
+        unique_chromosomes = genes.with_entities(Gene.chromosome).distinct().count()
+        unique_biotypes = genes.with_entities(Gene.biotype).distinct().count()
 
-        print("\n📊 Database Statistics:")
+        print(f"\n📊 Database Statistics ({assembly}):")
         print(f"   Total genes: {total_genes}")
         print(f"   Unique chromosomes: {unique_chromosomes}")
         print(f"   Unique biotypes: {unique_biotypes}")
@@ -115,16 +372,40 @@ def import_genes_from_csv(csv_file_path: str, batch_size: int = 1000) -> None:
         db.close()
 
 
-def main():
+def main() -> None:
     """Main function"""
-    if len(sys.argv) != 2:
-        print("Usage: python import_genes.py <path_to_csv_file>")
-        sys.exit(1)
-
-    csv_file_path = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Import gene data from a CSV file")
+    parser.add_argument("csv_file_path", help="Path to the semicolon-separated CSV")
+    parser.add_argument(
+        "--assembly",
+        default=settings.DEFAULT_ASSEMBLY,
+        help="Genome assembly of the genes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Rows inserted and checkpointed per commit (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted import from its last committed batch",
+    )
+    parser.add_argument(
+        "--rejected",
+        help="File collecting rejected rows (default: <csv>.rejected.csv)",
+    )
+    args = parser.parse_args()
 
     try:
-        import_genes_from_csv(csv_file_path)
+        import_genes_from_csv(
+            args.csv_file_path,
+            batch_size=args.batch_size,
+            assembly=args.assembly,
+            resume=args.resume,
+            rejected_file_path=args.rejected,
+        )
     except Exception as e:
         print(f"❌ Import failed: {e}")
         sys.exit(1)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start import time of the API and the import script.
+
+Each module is imported in a fresh interpreter several times and the median
+wall-clock time is reported, together with the number of modules loaded and
+whether the web stack or the database driver came along with it.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "app.core.config",
+    "app.core.database",
+    "app.models.gene",
+    "app.scripts.import_genes",
+    "app.main",
+]
+
+# Modules whose presence after an import is worth calling out
+WATCHED_MODULES = ["fastapi", "starlette", "psycopg2", "jose", "passlib"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules),
+    "loaded": [name for name in {watched!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure_module(module: str, runs: int) -> tuple[list[float], int, list[str]]:
+    """Import a module in fresh interpreters, returning timings and what loaded"""
+    probe = PROBE.format(module=module, watched=WATCHED_MODULES)
+    samples: list[float] = []
+    module_count = 0
+    loaded: list[str] = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", probe],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["seconds"])
+        module_count = result["modules"]
+        loaded = result["loaded"]
+
+    return samples, module_count, loaded
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=5, help="Imports per module")
+    args = parser.parse_args()
+
+    print(f"{'module':<28} {'median':>10} {'min':>10} {'modules':>8}  loaded")
+    for module in args.modules:
+        samples, module_count, loaded = measure_module(module, args.runs)
+        median_ms = statistics.median(samples) * 1000
+        min_ms = min(samples) * 1000
+        print(
+            f"{module:<28} {median_ms:>8.1f}ms {min_ms:>8.1f}ms "
+            f"{module_count:>8}  {', '.join(loaded) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
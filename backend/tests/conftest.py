@@ -5,9 +5,10 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.core.database import Base, get_db
+from app.core import generations
+from app.core.database import Base, get_db, get_read_db
 from app.main import app
-from app.models.gene import Gene
+from app.models.gene import Biotype, Chromosome, Gene, GeneCount, GeneImport
 
 # Use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -27,6 +28,7 @@ def override_get_db():
 
 # Override the database dependency
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -37,6 +39,13 @@ def setup_test_db():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def fresh_import_generations(monkeypatch):
+    """Start every test without a cached reading of the import generations"""
+    monkeypatch.setattr(generations, "_generations", None)
+    monkeypatch.setattr(generations, "_checked_at", float("-inf"))
+
+
 @pytest.fixture
 def db_session():
     """Get database session for testing"""
@@ -46,6 +55,10 @@ def db_session():
     finally:
         # Clean up data after each test
         db.query(Gene).delete()
+        db.query(Chromosome).delete()
+        db.query(Biotype).delete()
+        db.query(GeneCount).delete()
+        db.query(GeneImport).delete()
         db.commit()
         db.close()
 
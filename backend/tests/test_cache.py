@@ -0,0 +1,50 @@
+"""Test the in-process statistics cache"""
+
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_cache_reuses_value_within_ttl():
+    """Values are computed once while the entry is fresh"""
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_set("key", compute) == 1
+    assert cache.get_or_set("key", compute) == 1
+    assert len(calls) == 1
+
+
+def test_cache_disabled_with_zero_ttl():
+    """A zero TTL recomputes on every lookup"""
+    cache = TTLCache(ttl=0)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_set("key", compute) == 1
+    assert cache.get_or_set("key", compute) == 2
+
+
+def test_cache_clear():
+    """Clearing drops cached entries"""
+    cache = TTLCache(ttl=60)
+    cache.get_or_set("key", lambda: "old")
+    cache.clear()
+    assert cache.get_or_set("key", lambda: "new") == "new"
+
+
+def test_cache_drops_expired_entries(monkeypatch):
+    """Expired entries are dropped when a new one is stored"""
+    cache = TTLCache(ttl=60)
+    cache.set(("summary", "GRCh38", 1), "old")
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    cache.set(("summary", "GRCh38", 2), "new")
+    assert list(cache._entries) == [("summary", "GRCh38", 2)]
@@ -0,0 +1,79 @@
+"""Test total and facet counts for gene listings"""
+
+from app.core.counts import count_genes, refresh_gene_counts
+from app.models.gene import GeneCount
+
+
+def test_total_count_header(client, sample_genes):
+    """count=true sends X-Total-Count alongside the page"""
+    response = client.get("/api/v1/genes/?chromosome=17&limit=1&count=true")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert response.headers["X-Total-Count"] == "2"
+
+    response = client.get("/api/v1/genes/")
+    assert "X-Total-Count" not in response.headers
+
+
+def test_total_count_from_counters(client, db_session, sample_genes):
+    """Imported assemblies are counted from their counters"""
+    refresh_gene_counts(db_session, "GRCh38")
+
+    response = client.get("/api/v1/genes/?biotype=protein_coding&count=true")
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers["X-Total-Count-Source"] == "counters"
+
+    response = client.get("/api/v1/genes/?chromosome=13&count=true&exact=true")
+    assert response.headers["X-Total-Count"] == "1"
+    assert response.headers["X-Total-Count-Source"] == "exact"
+
+
+def test_counters_are_import_time(db_session, sample_genes):
+    """Counters keep their import-time value until refreshed; exact does not"""
+    refresh_gene_counts(db_session, "GRCh38")
+    db_session.delete(sample_genes[0])
+    db_session.commit()
+
+    assert count_genes(db_session, "GRCh38") == (3, "counters")
+    assert count_genes(db_session, "GRCh38", exact=True) == (2, "exact")
+
+    refresh_gene_counts(db_session, "GRCh38")
+    assert db_session.query(GeneCount).count() == 1
+    assert count_genes(db_session, "GRCh38") == (2, "counters")
+
+
+def test_count_without_counters(db_session, sample_genes):
+    """Without counters, SQLite falls back to an exact count"""
+    assert count_genes(db_session, "GRCh38", chromosome="17") == (2, "exact")
+    assert count_genes(db_session, "GRCh37") == (0, "exact")
+
+
+def test_total_count_with_encoding_and_fields(client, db_session, sample_genes):
+    """Counts work with every response shape"""
+    refresh_gene_counts(db_session, "GRCh38")
+
+    response = client.get("/api/v1/genes/?fields=ensembl&count=true")
+    assert response.headers["X-Total-Count"] == "3"
+    assert list(response.json()[0]) == ["ensembl"]
+
+
+def test_facets(client, db_session, sample_genes):
+    """Each facet is counted with the other facets' filters"""
+    for refresh in (False, True):
+        if refresh:
+            refresh_gene_counts(db_session, "GRCh38")
+
+        response = client.get("/api/v1/genes/stats/facets?chromosome=17")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == ("counters" if refresh else "exact")
+        assert data["total_genes"] == 2
+        assert data["facets"] == {
+            "chromosome": {"13": 1, "17": 2},
+            "biotype": {"protein_coding": 2},
+        }
+
+    response = client.get("/api/v1/genes/stats/facets?biotype=lncRNA")
+    data = response.json()
+    assert data["total_genes"] == 0
+    assert data["facets"] == {"chromosome": {}, "biotype": {"protein_coding": 3}}
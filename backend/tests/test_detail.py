@@ -0,0 +1,122 @@
+"""Test the gene detail aggregation endpoint"""
+
+from app.core.counts import refresh_gene_counts
+from app.models.gene import Gene
+
+
+def add_chromosome_17_neighbors(db_session):
+    """Add a few more chromosome 17 genes around TP53 and BRCA1"""
+    neighbors = [
+        Gene(
+            ensembl="ENSG00000000101",
+            gene_symbol="NEAR1",
+            biotype="lncRNA",
+            chromosome="17",
+            seq_region_start=1000,
+            seq_region_end=2000,
+        ),
+        Gene(
+            ensembl="ENSG00000000102",
+            gene_symbol="NEAR2",
+            biotype="protein_coding",
+            chromosome="17",
+            seq_region_start=20000000,
+            seq_region_end=20010000,
+        ),
+        Gene(
+            ensembl="ENSG00000000103",
+            gene_symbol="NEAR3",
+            biotype="lncRNA",
+            chromosome="17",
+            seq_region_start=50000000,
+            seq_region_end=50005000,
+        ),
+    ]
+    db_session.add_all(neighbors)
+    db_session.commit()
+
+
+def test_gene_detail(client, db_session, sample_genes):
+    """Detail returns the gene, its neighbors and chromosome aggregates"""
+    add_chromosome_17_neighbors(db_session)
+    tp53 = sample_genes[2]
+
+    response = client.get(f"/api/v1/genes/{tp53.id}/detail")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["gene"]["gene_symbol"] == "TP53"
+    assert [g["gene_symbol"] for g in data["upstream"]] == ["NEAR1"]
+    assert [g["gene_symbol"] for g in data["downstream"]] == [
+        "NEAR2",
+        "BRCA1",
+        "NEAR3",
+    ]
+
+    chromosome = data["chromosome"]
+    assert chromosome["chromosome"] == "17"
+    assert chromosome["gene_count"] == 5
+    assert chromosome["seq_region_start"] == 1000
+    assert chromosome["seq_region_end"] == 50005000
+    assert chromosome["biotypes"] == {"lncRNA": 2, "protein_coding": 3}
+
+
+def test_gene_detail_summary_from_counters(client, db_session, sample_genes):
+    """With counters, the chromosome summary is read from them, not the genes"""
+    add_chromosome_17_neighbors(db_session)
+    refresh_gene_counts(db_session, "GRCh38")
+    # Not counted until the next import
+    db_session.add(
+        Gene(
+            ensembl="ENSG00000000104",
+            gene_symbol="LATE",
+            biotype="miRNA",
+            chromosome="17",
+            seq_region_start=10,
+            seq_region_end=90000000,
+        )
+    )
+    db_session.commit()
+
+    response = client.get(f"/api/v1/genes/{sample_genes[2].id}/detail")
+    assert response.status_code == 200
+    assert response.json()["chromosome"] == {
+        "chromosome": "17",
+        "gene_count": 5,
+        "seq_region_start": 1000,
+        "seq_region_end": 50005000,
+        "biotypes": {"lncRNA": 2, "protein_coding": 3},
+    }
+
+
+def test_gene_detail_flank_limit(client, db_session, sample_genes):
+    """The flank parameter limits neighbors on each side"""
+    add_chromosome_17_neighbors(db_session)
+    brca1 = sample_genes[1]
+
+    response = client.get(f"/api/v1/genes/{brca1.id}/detail?flank=1")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert [g["gene_symbol"] for g in data["upstream"]] == ["NEAR2"]
+    assert [g["gene_symbol"] for g in data["downstream"]] == ["NEAR3"]
+
+
+def test_gene_detail_without_neighbors(client, sample_genes):
+    """A gene alone on its chromosome has no neighbors"""
+    brca2 = sample_genes[0]
+
+    response = client.get(f"/api/v1/genes/{brca2.id}/detail")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["upstream"] == []
+    assert data["downstream"] == []
+    assert data["chromosome"]["gene_count"] == 1
+
+
+def test_gene_detail_not_found(client):
+    """Detail for a missing gene returns 404"""
+    response = client.get("/api/v1/genes/999/detail")
+    assert response.status_code == 404
+    assert "Gene not found" in response.json()["detail"]
@@ -0,0 +1,80 @@
+"""Test dictionary-encoded gene list responses"""
+
+from app.core.dictionaries import load_dictionaries, refresh_dictionaries
+
+
+def test_refresh_dictionaries(db_session, sample_genes):
+    """Every chromosome and biotype value gets a code"""
+    refresh_dictionaries(db_session)
+    dictionaries = load_dictionaries(db_session)
+
+    assert set(dictionaries["chromosome"]) == {"13", "17"}
+    assert set(dictionaries["biotype"]) == {"protein_coding"}
+
+
+def test_refresh_dictionaries_keeps_codes(db_session, sample_genes):
+    """Refreshing again does not renumber existing codes"""
+    refresh_dictionaries(db_session)
+    before = load_dictionaries(db_session)
+    refresh_dictionaries(db_session)
+    assert load_dictionaries(db_session) == before
+
+
+def test_get_genes_dictionary_encoding(client, db_session, sample_genes):
+    """Encoded genes carry codes that the dictionaries map back to values"""
+    refresh_dictionaries(db_session)
+
+    plain = client.get("/api/v1/genes/").json()
+    response = client.get("/api/v1/genes/?encoding=dictionary")
+    assert response.status_code == 200
+    data = response.json()
+
+    chromosomes = data["dictionaries"]["chromosome"]
+    biotypes = data["dictionaries"]["biotype"]
+    assert sorted(chromosomes.values()) == ["13", "17"]
+    assert list(biotypes.values()) == ["protein_coding"]
+
+    decoded = [
+        {
+            **gene,
+            "chromosome": chromosomes[str(gene["chromosome"])],
+            "biotype": biotypes[str(gene["biotype"])],
+        }
+        for gene in data["genes"]
+    ]
+    assert decoded == plain
+
+
+def test_search_dictionary_encoding(client, db_session, sample_genes):
+    """Search endpoints support dictionary encoding too"""
+    refresh_dictionaries(db_session)
+
+    response = client.get("/api/v1/genes/search/symbol/BRCA?encoding=dictionary")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["genes"]) == 2
+    assert all(isinstance(gene["chromosome"], int) for gene in data["genes"])
+
+    response = client.get("/api/v1/genes/search/name/p53?encoding=dictionary")
+    assert response.status_code == 200
+    data = response.json()
+    assert [gene["gene_symbol"] for gene in data["genes"]] == ["TP53"]
+    assert list(data["dictionaries"]["chromosome"].values()) == ["17"]
+
+
+def test_invalid_encoding(client):
+    """Unknown encodings are rejected"""
+    response = client.get("/api/v1/genes/?encoding=gzip")
+    assert response.status_code == 422
+
+
+def test_dictionary_encoding_missing_codes(client, db_session, sample_genes):
+    """Genes without codes are reported clearly; the read assigns none"""
+    response = client.get("/api/v1/genes/?encoding=dictionary")
+    assert response.status_code == 503
+    assert "No dictionary code for chromosome" in response.json()["detail"]
+    assert "importer" in response.json()["detail"]
+    assert load_dictionaries(db_session) == {"chromosome": {}, "biotype": {}}
+
+    # Plain responses are unaffected
+    assert client.get("/api/v1/genes/").status_code == 200
@@ -0,0 +1,75 @@
+"""Test sparse fieldsets on gene list and search endpoints"""
+
+from app.core.dictionaries import refresh_dictionaries
+from tests.test_query_plans import captured_statements
+
+
+def test_get_genes_fields(client, sample_genes):
+    """Only the requested fields are returned, in the requested order"""
+    response = client.get("/api/v1/genes/?fields=ensembl,gene_symbol")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert len(data) == 3
+    assert list(data[0]) == ["ensembl", "gene_symbol"]
+    assert data[0] == {"ensembl": "ENSG00000139618", "gene_symbol": "BRCA2"}
+
+
+def test_get_genes_fields_selects_only_requested_columns(client, sample_genes):
+    """Unrequested columns are left out of the SQL SELECT"""
+    with captured_statements() as statements:
+        response = client.get(
+            "/api/v1/genes/?chromosome=17&fields=ensembl,seq_region_start"
+        )
+    assert response.status_code == 200
+
+    (statement, _), *_ = statements
+    select_list = statement.split("FROM")[0]
+    assert "genes.ensembl" in select_list
+    assert "genes.seq_region_start" in select_list
+    assert "genes.name" not in select_list
+    assert "genes.biotype" not in select_list
+
+
+def test_search_fields(client, sample_genes):
+    """Search endpoints accept fields too"""
+    response = client.get("/api/v1/genes/search/symbol/BRCA?fields=gene_symbol")
+    assert response.status_code == 200
+    assert sorted(gene["gene_symbol"] for gene in response.json()) == [
+        "BRCA1",
+        "BRCA2",
+    ]
+
+    response = client.get("/api/v1/genes/search/name/p53?fields=id,name")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data[0]) == {"id", "name"}
+
+
+def test_fields_with_dictionary_encoding(client, db_session, sample_genes):
+    """Projection and dictionary encoding combine"""
+    refresh_dictionaries(db_session)
+
+    response = client.get(
+        "/api/v1/genes/?fields=gene_symbol,chromosome&encoding=dictionary"
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert list(data["dictionaries"]) == ["chromosome"]
+    assert set(data["genes"][0]) == {"gene_symbol", "chromosome"}
+    assert isinstance(data["genes"][0]["chromosome"], int)
+
+
+def test_unknown_fields(client, sample_genes):
+    """Unknown fields are rejected"""
+    response = client.get("/api/v1/genes/?fields=ensembl,sequence")
+    assert response.status_code == 400
+    assert "Unknown fields: sequence" in response.json()["detail"]
+
+
+def test_empty_fields(client):
+    """An empty field list is rejected"""
+    response = client.get("/api/v1/genes/?fields=,")
+    assert response.status_code == 400
+    assert "Fields cannot be empty" in response.json()["detail"]
@@ -0,0 +1,160 @@
+"""Test typo-tolerant gene symbol search"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core import fuzzy
+from app.core.config import settings
+from app.core.fuzzy import SymSpellIndex, edit_distance, get_symbol_index
+from app.models.gene import Gene, GeneImport
+
+
+@pytest.fixture(autouse=True)
+def fresh_symbol_index(monkeypatch):
+    """Start every test without a cached symbol index"""
+    monkeypatch.setattr(fuzzy, "_symbol_index", None)
+    monkeypatch.setattr(fuzzy, "_symbol_index_generations", None)
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "distance"),
+    [
+        ("brca1", "brca1", 0),
+        ("brca1", "brca2", 1),
+        ("brac1", "brca1", 1),  # adjacent transposition
+        ("tp35", "tp53", 1),
+        ("tp53", "tp5", 1),
+        ("tp53", "atp53", 1),
+        ("kitten", "sitting", 3),
+        ("", "abc", 3),
+    ],
+)
+def test_edit_distance(a, b, distance):
+    """Edit distance counts insertions, deletions, substitutions and swaps"""
+    assert edit_distance(a, b) == distance
+    assert edit_distance(b, a) == distance
+
+
+def test_symspell_search():
+    """All words within the distance are found, closest first"""
+    index = SymSpellIndex(["brca1", "brca2", "tp53", "tp63", "egfr", "brca1"])
+    assert len(index) == 5
+
+    assert index.search("brac1", 2) == [(1, "brca1"), (2, "brca2")]
+    assert index.search("tp35", 1) == [(1, "tp53")]
+    assert index.search("tp53", 1) == [(0, "tp53"), (1, "tp63")]
+    assert index.search("xyz", 2) == []
+
+
+def test_symspell_search_long_query():
+    """Queries longer than any word within reach match nothing, quickly"""
+    index = SymSpellIndex(["brca1", "tp53"])
+    assert index.max_length == 5
+    assert index.search("brca1xx", 2) == [(2, "brca1")]
+    assert index.search("brca1xxx", 2) == []
+    assert index.search("x" * 1200, 2) == []
+
+
+def test_symspell_search_beyond_index_distance():
+    """Queries cannot ask for more edits than the index was built for"""
+    index = SymSpellIndex(["brca1"], max_distance=1)
+    with pytest.raises(ValueError):
+        index.search("brca1", 2)
+
+
+def test_fuzzy_symbol_search(client, sample_genes):
+    """Typos still find the gene, ranked by edit distance"""
+    response = client.get("/api/v1/genes/search/symbol/BRAC1?fuzzy=true")
+    assert response.status_code == 200
+    assert [gene["gene_symbol"] for gene in response.json()] == ["BRCA1", "BRCA2"]
+
+    response = client.get("/api/v1/genes/search/symbol/tp35?fuzzy=true")
+    assert response.status_code == 200
+    assert [gene["gene_symbol"] for gene in response.json()] == ["TP53"]
+
+
+def test_fuzzy_symbol_search_max_distance(client, sample_genes):
+    """max_distance limits how many edits are tolerated"""
+    response = client.get("/api/v1/genes/search/symbol/BRAC1?fuzzy=true&max_distance=1")
+    assert response.status_code == 200
+    assert [gene["gene_symbol"] for gene in response.json()] == ["BRCA1"]
+
+    response = client.get("/api/v1/genes/search/symbol/BRCA1?fuzzy=true&max_distance=5")
+    assert response.status_code == 422
+
+
+def test_fuzzy_symbol_search_no_match(client, sample_genes):
+    """Symbols too far from any gene return no results"""
+    response = client.get("/api/v1/genes/search/symbol/NOTFOUND?fuzzy=true")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_fuzzy_symbol_search_with_fields(client, sample_genes):
+    """Ranking does not depend on gene_symbol being projected"""
+    response = client.get("/api/v1/genes/search/symbol/BRAC1?fuzzy=true&fields=ensembl")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"ensembl": "ENSG00000012048"},
+        {"ensembl": "ENSG00000139618"},
+    ]
+
+
+def test_fuzzy_symbol_search_long_query(client, sample_genes):
+    """Overlong fuzzy queries return no genes instead of expanding every delete"""
+    response = client.get(f"/api/v1/genes/search/symbol/{'A' * 1200}?fuzzy=true")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def add_gene_and_import(db_session, symbol):
+    """Add a gene and record a completed import, as the importer would"""
+    db_session.add(
+        Gene(
+            ensembl="ENSG00000146648",
+            gene_symbol=symbol,
+            biotype="protein_coding",
+            chromosome="7",
+            seq_region_start=55019017,
+            seq_region_end=55211628,
+        )
+    )
+    record = db_session.get(GeneImport, "GRCh38") or GeneImport(
+        assembly="GRCh38", generation=0
+    )
+    record.generation += 1
+    record.imported_at = datetime.now(UTC)
+    db_session.add(record)
+    db_session.commit()
+
+
+def test_symbol_index_rebuilt_after_import(db_session, sample_genes, monkeypatch):
+    """A completed import is picked up at the next generation check"""
+    monkeypatch.setattr(settings, "IMPORT_CHECK_SECONDS", 0)
+    index = get_symbol_index(db_session)
+    assert index.search("egrf", 1) == []
+    assert get_symbol_index(db_session) is index
+
+    add_gene_and_import(db_session, "EGFR")
+    assert get_symbol_index(db_session).search("egrf", 1) == [(1, "egfr")]
+
+
+def test_symbol_index_checked_once_per_interval(db_session, sample_genes):
+    """Within the check interval the cached index is served without queries"""
+    index = get_symbol_index(db_session)
+    add_gene_and_import(db_session, "EGFR")
+    assert get_symbol_index(db_session) is index
+
+
+def test_stale_symbol_index_served_during_rebuild(
+    db_session, sample_genes, monkeypatch
+):
+    """Requests keep the old index while another request builds its replacement"""
+    monkeypatch.setattr(settings, "IMPORT_CHECK_SECONDS", 0)
+    index = get_symbol_index(db_session)
+    add_gene_and_import(db_session, "EGFR")
+
+    with fuzzy._build_lock:
+        assert get_symbol_index(db_session) is index
+    assert get_symbol_index(db_session) is not index
@@ -0,0 +1,180 @@
+"""Test the checkpointed gene importer"""
+
+import csv
+
+import pytest
+
+from app.core.counts import count_genes
+from app.models.gene import Gene, GeneCount, GeneImport, GeneImportCheckpoint
+from app.scripts import import_genes
+from tests.conftest import TestingSessionLocal, engine
+
+HEADER = [
+    "Ensembl",
+    "Gene symbol",
+    "Name",
+    "Biotype",
+    "Chromosome",
+    "Seq region start",
+    "Seq region end",
+]
+
+ROWS = [
+    ["ENSG00000139618", "BRCA2", "BRCA2 DNA repair", "protein_coding", "13", "1", "2"],
+    ["ENSG00000012048", "BRCA1", "BRCA1 DNA repair", "protein_coding", "17", "3", "4"],
+    ["", "NOID", "missing id", "protein_coding", "17", "5", "6"],
+    ["ENSG00000141510", "TP53", "tumor protein; p53", "protein_coding", "17", "7", "8"],
+    ["ENSG00000000001", "BAD", "bad start", "lncRNA", "1", "start", "9"],
+    ["ENSG00000000002", "MULTI", "two\nlines", "lncRNA", "1", "10", "11"],
+    ["ENSG00000000003", "LAST", "last gene", "lncRNA", "X", "12", "13"],
+]
+
+
+@pytest.fixture
+def gene_csv(tmp_path, monkeypatch, db_session):
+    """A gene CSV, and the importer pointed at the test database"""
+    monkeypatch.setattr(import_genes, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(import_genes, "get_engine", lambda: engine)
+
+    path = tmp_path / "genes.csv"
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(HEADER)
+        writer.writerows(ROWS)
+    yield path
+    db_session.query(GeneImportCheckpoint).delete()
+    db_session.commit()
+
+
+def read_rejects(path):
+    with open(path.with_suffix(".rejected.csv"), encoding="utf-8", newline="") as f:
+        return list(csv.reader(f, delimiter=";"))
+
+
+def test_import(gene_csv, db_session):
+    """Valid rows are imported; rejected rows are collected with the reason"""
+    import_genes.import_genes_from_csv(str(gene_csv), batch_size=2)
+
+    symbols = {gene.gene_symbol for gene in db_session.query(Gene)}
+    assert symbols == {"BRCA2", "BRCA1", "TP53", "MULTI", "LAST"}
+    assert db_session.query(GeneCount).count() == 4
+    assert db_session.query(GeneImportCheckpoint).count() == 0
+    assert db_session.get(GeneImport, "GRCh38").generation == 1
+
+    header, *rejects = read_rejects(gene_csv)
+    assert header == ["Row", "Error", *HEADER]
+    assert [row[:3] for row in rejects] == [
+        ["4", "missing Ensembl ID", ""],
+        ["6", "invalid literal for int() with base 10: 'start'", "ENSG00000000001"],
+    ]
+
+
+def test_import_rejects_duplicates(gene_csv, db_session):
+    """Rows the database refuses are rejected; the rest of their batch imports"""
+    with open(gene_csv, "a", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        new = ["ENSG00000000004", "NEW", "new", "lncRNA", "Y", "1", "2"]
+        writer.writerow(ROWS[0])  # duplicate of a previous batch
+        writer.writerow(new)
+        writer.writerow(new)  # duplicate within its batch
+
+    import_genes.import_genes_from_csv(str(gene_csv), batch_size=2)
+
+    symbols = sorted(gene.gene_symbol for gene in db_session.query(Gene))
+    assert symbols == ["BRCA1", "BRCA2", "LAST", "MULTI", "NEW", "TP53"]
+    assert db_session.query(GeneImportCheckpoint).count() == 0
+
+    _, *rejects = read_rejects(gene_csv)
+    duplicates = [row for row in rejects if row[0] in {"9", "11"}]
+    assert [row[0] for row in duplicates] == ["9", "11"]
+    assert all("UNIQUE constraint failed" in row[1] for row in duplicates)
+    assert [row[2] for row in duplicates] == [ROWS[0][0], "ENSG00000000004"]
+
+
+def test_resume_after_crash(gene_csv, db_session, monkeypatch):
+    """A resumed import continues after the last committed batch"""
+    insert_batch = import_genes.insert_batch
+    calls = []
+
+    def crash_on_second_batch(*args):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return insert_batch(*args)
+
+    monkeypatch.setattr(import_genes, "insert_batch", crash_on_second_batch)
+    with pytest.raises(RuntimeError):
+        import_genes.import_genes_from_csv(str(gene_csv), batch_size=2)
+
+    checkpoint = db_session.query(GeneImportCheckpoint).one()
+    assert (checkpoint.row_number, checkpoint.imported_count) == (3, 2)
+    assert db_session.query(Gene).count() == 2
+
+    monkeypatch.setattr(import_genes, "insert_batch", insert_batch)
+    import_genes.import_genes_from_csv(str(gene_csv), batch_size=2, resume=True)
+
+    assert sorted(gene.gene_symbol for gene in db_session.query(Gene)) == [
+        "BRCA1",
+        "BRCA2",
+        "LAST",
+        "MULTI",
+        "TP53",
+    ]
+    assert db_session.query(GeneImportCheckpoint).count() == 0
+    # Rejects written by the failed batch are not repeated
+    assert len(read_rejects(gene_csv)) == 3
+
+
+def test_interrupted_import_drops_counters(gene_csv, db_session, monkeypatch):
+    """Counts do not report the previous import while a re-import is unfinished"""
+    import_genes.import_genes_from_csv(str(gene_csv), batch_size=2)
+    assert count_genes(db_session, "GRCh38") == (5, "counters")
+
+    insert_batch = import_genes.insert_batch
+    calls = []
+
+    def crash_on_second_batch(*args):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return insert_batch(*args)
+
+    monkeypatch.setattr(import_genes, "insert_batch", crash_on_second_batch)
+    with pytest.raises(RuntimeError):
+        import_genes.import_genes_from_csv(str(gene_csv), batch_size=2)
+
+    assert db_session.query(GeneCount).count() == 0
+    assert count_genes(db_session, "GRCh38") == (2, "exact")
+
+
+def test_resume_requires_checkpoint(gene_csv):
+    """Nothing to resume without an interrupted import"""
+    with pytest.raises(RuntimeError, match="No interrupted GRCh38 import"):
+        import_genes.import_genes_from_csv(str(gene_csv), resume=True)
+
+
+def test_resume_rejects_changed_file(gene_csv, db_session, monkeypatch):
+    """A checkpoint only resumes the file it was recorded for"""
+    monkeypatch.setattr(
+        import_genes, "insert_batch", lambda *args: (_ for _ in ()).throw(OSError)
+    )
+    with pytest.raises(OSError):
+        import_genes.import_genes_from_csv(str(gene_csv))
+
+    with open(gene_csv, "a", encoding="utf-8") as file:
+        file.write("ENSG00000000004;NEW;new;lncRNA;Y;1;2\n")
+    with pytest.raises(RuntimeError, match="cannot be resumed"):
+        import_genes.import_genes_from_csv(str(gene_csv), resume=True)
+
+
+def test_line_reader_offsets(tmp_path):
+    """Offsets land just past each record, including multi-line ones"""
+    path = tmp_path / "lines.csv"
+    path.write_bytes(b'a;b\n1;"x\ny"\n2;z\n')
+
+    with open(path, "rb") as file:
+        lines = import_genes.LineReader(file)
+        reader = csv.reader(lines, delimiter=";")
+        offsets = [lines.offset for _ in reader]
+
+    assert offsets == [4, 12, 16]
@@ -0,0 +1,169 @@
+"""Test assembly scoping and partition management"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.partitioning import ensure_partitions, partition_name
+from app.models.gene import Gene
+
+
+class RecordingConnection:
+    """Stand-in PostgreSQL connection whose genes table is partitioned"""
+
+    dialect = postgresql.dialect()
+
+    def __init__(self, existing=()):
+        self.statements = []
+        # (name, parent, bound) rows of relations already in pg_class
+        self.existing = list(existing)
+
+    def execute(self, statement, parameters=None):
+        self.statements.append(str(statement))
+        return self
+
+    def scalar(self):
+        return True
+
+    def __iter__(self):
+        return iter(self.existing)
+
+
+def test_partition_name():
+    """Partition names are lower-case identifiers"""
+    assert partition_name("GRCh38") == "genes_grch38"
+    assert partition_name("GRCh38", "X") == "genes_grch38_x"
+    assert partition_name("GRCh38", "KI270728.1") == "genes_grch38_ki270728_1"
+    assert len(partition_name("A" * 50, "B" * 50)) == 63
+
+
+def test_ensure_partitions():
+    """The assembly partition and one partition per chromosome are created"""
+    connection = RecordingConnection()
+    ensure_partitions(connection, "GRCh38", ["17", "13", "17"])
+
+    _, _, *ddl = connection.statements
+    assert ddl == [
+        "CREATE TABLE IF NOT EXISTS genes_grch38 PARTITION OF genes "
+        "FOR VALUES IN ('GRCh38') PARTITION BY LIST (chromosome)",
+        "CREATE TABLE IF NOT EXISTS genes_grch38_default "
+        "PARTITION OF genes_grch38 DEFAULT",
+        "CREATE TABLE IF NOT EXISTS genes_grch38_13 PARTITION OF genes_grch38 "
+        "FOR VALUES IN ('13')",
+        "CREATE TABLE IF NOT EXISTS genes_grch38_17 PARTITION OF genes_grch38 "
+        "FOR VALUES IN ('17')",
+    ]
+
+
+def test_ensure_partitions_skips_existing():
+    """Partitions that already exist with the same bounds are left alone"""
+    connection = RecordingConnection(
+        [
+            ("genes_grch38", "genes", "FOR VALUES IN ('GRCh38')"),
+            ("genes_grch38_default", "genes_grch38", "DEFAULT"),
+            ("genes_grch38_17", "genes_grch38", "FOR VALUES IN ('17')"),
+        ]
+    )
+    ensure_partitions(connection, "GRCh38", ["17", "13"])
+
+    _, _, *ddl = connection.statements
+    assert ddl == [
+        "CREATE TABLE IF NOT EXISTS genes_grch38_13 PARTITION OF genes_grch38 "
+        "FOR VALUES IN ('13')",
+    ]
+
+
+def test_ensure_partitions_name_taken():
+    """A partition name held by other bounds is an error, not a silent skip"""
+    connection = RecordingConnection(
+        [
+            ("genes_grch38", "genes", "FOR VALUES IN ('grch38')"),
+            ("genes_grch38_default", "genes_grch38", "DEFAULT"),
+        ]
+    )
+    with pytest.raises(ValueError, match="genes_grch38 .*taken"):
+        ensure_partitions(connection, "GRCh38", ["17"])
+    assert len(connection.statements) == 2
+
+
+def test_ensure_partitions_names_collide():
+    """Chromosomes mapping to the same partition name are an error"""
+    connection = RecordingConnection()
+    with pytest.raises(ValueError, match="genes_grch38_1_1"):
+        ensure_partitions(connection, "GRCh38", ["1.1", "1_1"])
+    assert len(connection.statements) == 1
+
+
+def test_ensure_partitions_unpartitioned(db_session):
+    """Nothing is created on SQLite"""
+    ensure_partitions(db_session.connection(), "GRCh38", ["17"])
+    db_session.rollback()
+
+
+def add_grch37_gene(db_session):
+    gene = Gene(
+        assembly="GRCh37",
+        ensembl="ENSG00000141510",
+        gene_symbol="TP53",
+        name="tumor protein p53",
+        biotype="protein_coding",
+        chromosome="17",
+        seq_region_start=7565097,
+        seq_region_end=7590856,
+    )
+    db_session.add(gene)
+    db_session.commit()
+    return gene
+
+
+def test_routes_default_to_default_assembly(client, db_session, sample_genes):
+    """Genes of other assemblies stay out of default requests"""
+    add_grch37_gene(db_session)
+
+    response = client.get("/api/v1/genes/?chromosome=17")
+    assert response.status_code == 200
+    assert {gene["assembly"] for gene in response.json()} == {"GRCh38"}
+    assert len(response.json()) == 2
+
+    response = client.get("/api/v1/genes/search/ensembl/ENSG00000141510")
+    assert response.json()["seq_region_start"] == 7661779
+
+    response = client.get("/api/v1/genes/stats/summary")
+    assert response.json()["total_genes"] == 3
+
+
+def test_routes_select_assembly(client, db_session, sample_genes):
+    """?assembly= scopes lists, searches and statistics"""
+    add_grch37_gene(db_session)
+
+    response = client.get("/api/v1/genes/?chromosome=17&assembly=GRCh37")
+    assert [gene["seq_region_start"] for gene in response.json()] == [7565097]
+
+    response = client.get("/api/v1/genes/search/symbol/TP53?exact=true&assembly=GRCh37")
+    assert [gene["assembly"] for gene in response.json()] == ["GRCh37"]
+
+    response = client.get(
+        "/api/v1/genes/search/ensembl/ENSG00000141510?assembly=GRCh37"
+    )
+    assert response.json()["seq_region_start"] == 7565097
+
+    response = client.get("/api/v1/genes/stats/summary?assembly=GRCh37")
+    assert response.json() == {
+        "total_genes": 1,
+        "chromosomes": ["17"],
+        "biotypes": ["protein_coding"],
+    }
+
+    response = client.get("/api/v1/genes/?assembly=T2T-CHM13")
+    assert response.json() == []
+
+
+def test_detail_neighbors_stay_in_assembly(client, db_session, sample_genes):
+    """Flanking genes and the chromosome summary come from the gene's assembly"""
+    gene = add_grch37_gene(db_session)
+
+    response = client.get(f"/api/v1/genes/{gene.id}/detail")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["upstream"] == []
+    assert data["downstream"] == []
+    assert data["chromosome"]["gene_count"] == 1
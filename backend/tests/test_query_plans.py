@@ -0,0 +1,112 @@
+"""Test that gene routes are served by index searches"""
+
+import re
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import engine
+
+
+@contextmanager
+def captured_statements():
+    """Record every SELECT the application issues against the test engine"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def query_plan(statement, parameters):
+    """Return the SQLite query plan details for a statement"""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+# Plan steps reading a table; CTEs and subqueries are scanned by name instead
+TABLE_STEP = re.compile(r"^(SCAN|SEARCH) (genes|gene_counts)\b")
+
+
+def table_steps(plan):
+    return [step for step in plan if TABLE_STEP.match(step)]
+
+
+def only_index_searches(plan):
+    """Every table access is an index SEARCH; SCAN (even of a covering index)
+    reads the whole table or index"""
+    steps = table_steps(plan)
+    return bool(steps) and all(step.startswith("SEARCH ") for step in steps)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/genes/1",
+        "/api/v1/genes/1/detail",
+        "/api/v1/genes/?chromosome=17",
+        "/api/v1/genes/?chromosome=17&biotype=protein_coding",
+        "/api/v1/genes/?biotype=protein_coding",
+        "/api/v1/genes/search/symbol/brca1?exact=true",
+        "/api/v1/genes/search/ensembl/ENSG00000139618",
+        "/api/v1/genes/stats/summary",
+        "/api/v1/genes/?chromosome=17&count=true",
+        "/api/v1/genes/stats/facets?biotype=protein_coding",
+    ],
+)
+def test_route_uses_index(client, sample_genes, url):
+    """Every statement issued by the route should be served by index searches"""
+    with captured_statements() as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert statements
+
+    for statement, parameters in statements:
+        if "FROM gene_imports" in statement:
+            # One row per assembly, read at most every IMPORT_CHECK_SECONDS
+            continue
+        plan = query_plan(statement, parameters)
+        assert only_index_searches(plan), (
+            f"{statement!r} is not served by index searches: {plan}"
+        )
+
+
+def test_ensembl_is_unique(db_session, sample_genes):
+    """Duplicate Ensembl IDs are rejected by the unique constraint"""
+    from sqlalchemy.exc import IntegrityError
+
+    from app.models.gene import Gene
+
+    db_session.add(
+        Gene(
+            ensembl="ENSG00000139618",
+            gene_symbol="DUP",
+            biotype="protein_coding",
+            chromosome="13",
+            seq_region_start=1,
+            seq_region_end=2,
+        )
+    )
+    with pytest.raises(IntegrityError):
+        db_session.commit()
+    db_session.rollback()
+
+
+def test_full_scans_are_rejected():
+    """A covering index scan reads the whole index and does not count"""
+    assert not only_index_searches(["SCAN genes USING COVERING INDEX ix_genes_id"])
+    assert not only_index_searches(["SCAN genes"])
+    assert not only_index_searches(
+        ["SEARCH genes USING INTEGER PRIMARY KEY (rowid=?)", "SCAN genes"]
+    )
+    assert only_index_searches(
+        ["SEARCH genes USING INDEX ix_genes_assembly_biotype (assembly=?)", "SCAN t"]
+    )
@@ -0,0 +1,115 @@
+"""Test read-replica selection"""
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from app.core import database
+from app.core.database import get_read_db
+from app.core.replicas import ReplicaSet
+from app.models.gene import Gene
+from tests.conftest import engine as primary_engine
+
+
+def healthy_engine():
+    return create_engine("sqlite://")
+
+
+def unreachable_engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path}/missing/replica.db")
+
+
+def test_round_robin():
+    """Reads are spread over all healthy replicas in turn"""
+    engines = [healthy_engine(), healthy_engine()]
+    replicas = ReplicaSet(engines, check_interval=60)
+
+    assert [replicas.choose() for _ in range(4)] == engines * 2
+
+
+def test_unhealthy_replica_is_skipped(tmp_path):
+    """A replica failing its health check is skipped until the next check"""
+    down, up = unreachable_engine(tmp_path), healthy_engine()
+    replicas = ReplicaSet([down, up], check_interval=60)
+
+    assert [replicas.choose() for _ in range(3)] == [up, up, up]
+
+
+def test_replica_is_rechecked():
+    """A replica marked down is used again once it passes a check"""
+    engine = healthy_engine()
+    replicas = ReplicaSet([engine], check_interval=0)
+
+    replicas.mark_down(0)
+    assert replicas.choose() is engine
+
+
+def test_fallback_to_primary(tmp_path):
+    """No healthy replica (or none configured) means reads use the primary"""
+    assert ReplicaSet([], check_interval=60).choose() is None
+
+    replicas = ReplicaSet([unreachable_engine(tmp_path)], check_interval=60)
+    assert replicas.choose() is None
+    assert replicas.choose() is None
+
+
+def test_concurrent_requests_do_not_repeat_a_due_check(monkeypatch):
+    """Only the request that finds a check due pings; the others skip it"""
+    engine = healthy_engine()
+    replicas = ReplicaSet([engine], check_interval=60)
+    replicas.mark_down(0)
+    replicas._checked_at[0] = float("-inf")
+
+    pings = []
+    check = replicas.check
+
+    def check_during_request(index):
+        pings.append(index)
+        # A request arriving mid-ping goes by the last result
+        assert replicas.choose() is None
+        return check(index)
+
+    monkeypatch.setattr(replicas, "check", check_during_request)
+    assert replicas.choose() is engine
+    assert pings == [0]
+
+
+@pytest.fixture
+def read_db(monkeypatch):
+    """get_read_db() with the test database as primary and the given replicas"""
+
+    def read_db(*replicas):
+        monkeypatch.setattr(database, "_engine", primary_engine)
+        monkeypatch.setattr(database, "_replicas", ReplicaSet(replicas, 60))
+        return get_read_db()
+
+    return read_db
+
+
+def test_read_db_uses_primary_without_replicas(read_db):
+    """Without a healthy replica, read sessions are bound to the primary"""
+    db = next(read_db())
+    assert db.get_bind() is primary_engine
+
+
+def test_read_db_uses_replica(read_db):
+    """Read sessions are bound to the chosen replica"""
+    replica = healthy_engine()
+    db = next(read_db(replica))
+    assert db.get_bind() is replica
+
+
+def test_read_db_retries_on_primary_after_disconnect(read_db, sample_genes):
+    """A replica connection dropping mid-query moves the read to the primary"""
+    replica = healthy_engine()
+
+    @event.listens_for(replica, "handle_error")
+    def drop_connection(context):
+        # The replica has no genes table; report the error as a disconnect
+        context.is_disconnect = True
+
+    sessions = read_db(replica)
+    db = next(sessions)
+    assert db.query(Gene).count() == 3
+    assert db.get_bind() is primary_engine
+    assert database._replicas.choose() is None
+    sessions.close()
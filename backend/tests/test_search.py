@@ -11,6 +11,13 @@ def test_search_by_symbol_exact(client, sample_genes):
     assert data[0]["ensembl"] == "ENSG00000012048"
 
 
+def test_search_by_symbol_exact_ignores_case(client, sample_genes):
+    """Exact symbol search matches regardless of case"""
+    response = client.get("/api/v1/genes/search/symbol/brca1?exact=true")
+    assert response.status_code == 200
+    assert [gene["gene_symbol"] for gene in response.json()] == ["BRCA1"]
+
+
 def test_search_by_symbol_partial(client, sample_genes):
     """Test partial symbol search"""
     response = client.get("/api/v1/genes/search/symbol/BRCA")
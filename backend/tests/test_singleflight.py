@@ -0,0 +1,97 @@
+"""Test request coalescing for identical concurrent reads"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.singleflight import SingleFlight, coalesce
+
+
+def run_concurrently(fn, count=8):
+    """Call fn from several threads released at the same moment"""
+    barrier = threading.Barrier(count)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(call) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+def test_concurrent_calls_share_one_execution():
+    """Callers arriving while a call is in flight share its result"""
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results = run_concurrently(lambda: flight.do("key", slow))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_different_keys_run_separately():
+    """Only calls with the same key are coalesced"""
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+
+
+def test_sequential_calls_are_not_cached():
+    """Once a call completes, the next one runs again"""
+    flight = SingleFlight()
+    calls = []
+    flight.do("key", lambda: calls.append(1))
+    flight.do("key", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_exceptions_are_shared():
+    """Waiters see the leader's exception"""
+    flight = SingleFlight()
+
+    def failing():
+        time.sleep(0.2)
+        raise HTTPException(status_code=404, detail="Gene not found")
+
+    def call():
+        with pytest.raises(HTTPException) as exc_info:
+            flight.do("key", failing)
+        return exc_info.value.status_code
+
+    assert run_concurrently(call) == [404] * 8
+
+
+def test_coalesced_handler_keys_on_parameters():
+    """Handlers are coalesced per parameter set, ignoring the session"""
+    calls = []
+
+    @coalesce(dict[str, int])
+    def handler(chromosome: str, db=None):
+        calls.append(chromosome)
+        time.sleep(0.2)
+        return {"count": len(chromosome)}
+
+    responses = run_concurrently(lambda: handler(chromosome="17", db=object()))
+    assert calls == ["17"]
+    assert {response.body for response in responses} == {b'{"count":2}'}
+
+    handler(chromosome="X", db=object())
+    assert calls == ["17", "X"]
+
+
+def test_coalesced_route(client, sample_genes):
+    """Coalesced routes still serialize like their response model"""
+    response = client.get("/api/v1/genes/?chromosome=17")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert sorted(gene["gene_symbol"] for gene in response.json()) == ["BRCA1", "TP53"]
@@ -0,0 +1,33 @@
+"""Test that importing the app and the import script stays cheap"""
+
+import json
+import subprocess
+import sys
+
+
+def import_in_fresh_interpreter(module, expression):
+    """Import a module in a new interpreter and evaluate an expression there"""
+    code = f"import json, sys\nimport {module}\nprint(json.dumps({expression}))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_importer_does_not_load_web_stack():
+    """The CSV importer must not pay for FastAPI"""
+    loaded = import_in_fresh_interpreter(
+        "app.scripts.import_genes",
+        "[m for m in ('fastapi', 'starlette') if m in sys.modules]",
+    )
+    assert loaded == []
+
+
+def test_app_import_does_not_create_engine():
+    """The engine and database driver are created lazily, not at import"""
+    result = import_in_fresh_interpreter(
+        "app.main",
+        "{'engine': sys.modules['app.core.database']._engine is not None,"
+        " 'driver': 'psycopg2' in sys.modules}",
+    )
+    assert result == {"engine": False, "driver": False}
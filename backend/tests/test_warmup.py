@@ -0,0 +1,83 @@
+"""Test startup warm-up"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core import warmup
+from app.core.cache import stats_cache
+from app.core.config import settings
+from app.models.gene import Gene, GeneImport
+from tests.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+def warm_cache(monkeypatch):
+    """An enabled stats cache and warm-up pointed at the test database"""
+    monkeypatch.setattr(warmup, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(warmup, "get_engine", lambda: engine)
+    monkeypatch.setattr(warmup, "dispose_engine", lambda: None)
+    monkeypatch.setattr(stats_cache, "ttl", 60)
+    stats_cache.clear()
+    yield stats_cache
+    stats_cache.clear()
+
+
+def cached(cache, key):
+    return cache.get_or_set(key, lambda: pytest.fail(f"{key!r} was not warmed up"))
+
+
+def test_warm_up_fills_stats_cache(warm_cache, sample_genes):
+    """Statistics and chromosome summaries are cached before the first request"""
+    warmup.warm_up()
+
+    assert cached(warm_cache, ("summary", "GRCh38", 0)) == {
+        "total_genes": 3,
+        "chromosomes": ["13", "17"],
+        "biotypes": ["protein_coding"],
+    }
+    assert cached(warm_cache, ("chromosome", "GRCh38", "17", 0))["gene_count"] == 2
+
+
+def test_import_replaces_warmed_statistics(
+    warm_cache, client, db_session, sample_genes, monkeypatch
+):
+    """A completed import is served without waiting for cached entries to expire"""
+    monkeypatch.setattr(settings, "IMPORT_CHECK_SECONDS", 0)
+    warmup.warm_up()
+
+    db_session.add(
+        Gene(
+            ensembl="ENSG00000146648",
+            gene_symbol="EGFR",
+            biotype="protein_coding",
+            chromosome="7",
+            seq_region_start=55019017,
+            seq_region_end=55211628,
+            assembly="GRCh38",
+        )
+    )
+    db_session.commit()
+    response = client.get("/api/v1/genes/stats/summary")
+    assert response.json()["total_genes"] == 3
+
+    db_session.add(
+        GeneImport(assembly="GRCh38", generation=1, imported_at=datetime.now(UTC))
+    )
+    db_session.commit()
+    response = client.get("/api/v1/genes/stats/summary")
+    assert response.json()["total_genes"] == 4
+
+
+def test_warm_up_survives_failing_step(warm_cache, monkeypatch, caplog):
+    """A failing step is logged and the remaining steps still run"""
+    ran = []
+
+    def failing(db):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(warmup, "_warmups", [failing, ran.append])
+    warmup.warm_up()
+
+    assert len(ran) == 1
+    assert "Warm-up step failing failed" in caplog.text
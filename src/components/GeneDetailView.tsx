@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useEffect, useState } from 'react';
 import {
   Card,
   Title,
@@ -11,6 +11,7 @@ import {
 } from '@mantine/core';
 import { IconDna2 } from '@tabler/icons-react';
 import type { Gene } from '../types/gene.types';
+import { geneApi, type GeneDetail } from '../utils/apiClient';
 import { BiotypeChart } from './charts/BiotypeChart';
 import { ChromosomeChart } from './charts/ChromosomeChart';
 import './GeneDetailView.css';
@@ -21,6 +22,28 @@ interface GeneDetailViewProps {
 }
 
 export const GeneDetailView = React.memo(function GeneDetailView({ gene, allGenes }: GeneDetailViewProps) {
+  // Genes from the API have an id; fetch their neighbors and chromosome
+  // summary from the backend. CSV genes are summarized from allGenes.
+  const geneId = gene?.id;
+  const [detail, setDetail] = useState<GeneDetail | null>(null);
+
+  useEffect(() => {
+    if (geneId === undefined) return;
+
+    let cancelled = false;
+    geneApi
+      .getGeneDetail(geneId)
+      .then(result => {
+        if (!cancelled) setDetail(result);
+      })
+      .catch(() => {
+        // Keep the charts computed from allGenes
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [geneId]);
+
   // Show empty state if no gene selected
   if (!gene) {
     return (
@@ -44,6 +67,9 @@ export const GeneDetailView = React.memo(function GeneDetailView({ gene, allGene
     );
   }
 
+  // Ignore a detail response still showing the previously selected gene
+  const geneDetail = detail?.gene.id === gene.id ? detail : null;
+
   // Calculate basic gene information
   const geneLength = gene.seqRegionEnd - gene.seqRegionStart;
   const geneLengthKb = (geneLength / 1000).toFixed(1);
@@ -153,12 +179,41 @@ export const GeneDetailView = React.memo(function GeneDetailView({ gene, allGene
               </Badge>
             </Group>
           </Paper>
+
+          {/* Neighboring genes along the chromosome */}
+          {geneDetail && (
+            <Paper p="md" withBorder radius="md">
+              <Text size="sm" fw={600} mb="sm">
+                Neighboring Genes ({geneDetail.chromosome.geneCount.toLocaleString()}{' '}
+                genes on Chr {geneDetail.chromosome.chromosome})
+              </Text>
+              <Group spacing="xs">
+                {geneDetail.upstream.map(neighbor => (
+                  <Badge key={neighbor.ensembl} variant="light" color="gray">
+                    {neighbor.geneSymbol || neighbor.ensembl}
+                  </Badge>
+                ))}
+                <Badge variant="filled" color="blue">
+                  {gene.geneSymbol || gene.ensembl}
+                </Badge>
+                {geneDetail.downstream.map(neighbor => (
+                  <Badge key={neighbor.ensembl} variant="light" color="gray">
+                    {neighbor.geneSymbol || neighbor.ensembl}
+                  </Badge>
+                ))}
+              </Group>
+            </Paper>
+          )}
         </Stack>
       </Card>
 
       {/* 1x2 Grid of Visualizations */}
       <SimpleGrid cols={2} spacing="md">
-        <BiotypeChart gene={gene} allGenes={allGenes} />
+        <BiotypeChart
+          gene={gene}
+          allGenes={allGenes}
+          biotypeCounts={geneDetail?.chromosome.biotypes}
+        />
         <ChromosomeChart gene={gene} allGenes={allGenes} />
       </SimpleGrid>
     </Stack>
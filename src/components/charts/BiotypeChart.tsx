@@ -6,9 +6,11 @@ import type { Gene } from '../../types/gene.types';
 interface BiotypeChartProps {
   gene: Gene;
   allGenes: Gene[];
+  // Biotype counts of the gene's chromosome from the backend, when available
+  biotypeCounts?: Record<string, number>;
 }
 
-export const BiotypeChart = React.memo(function BiotypeChart({ gene, allGenes }: BiotypeChartProps) {
+export const BiotypeChart = React.memo(function BiotypeChart({ gene, allGenes, biotypeCounts }: BiotypeChartProps) {
   // Use Mantine theme to detect dark mode
   const theme = useMantineTheme();
   const isDarkMode = theme.colorScheme === 'dark';
@@ -16,16 +18,18 @@ export const BiotypeChart = React.memo(function BiotypeChart({ gene, allGenes }:
   const textColor = isDarkMode ? theme.colors.gray[2] : theme.colors.dark[8];
 
   const chartData = useMemo(() => {
-    // Count biotypes on the same chromosome
-    const chromosomeGenes = allGenes.filter(
-      g => g.chromosome === gene.chromosome
-    );
-    const biotypeCount: Record<string, number> = {};
+    // Count biotypes on the same chromosome, unless the backend counted them
+    const biotypeCount: Record<string, number> = biotypeCounts ?? {};
 
-    chromosomeGenes.forEach(g => {
-      const biotype = g.biotype || 'Unknown';
-      biotypeCount[biotype] = (biotypeCount[biotype] || 0) + 1;
-    });
+    if (!biotypeCounts) {
+      const chromosomeGenes = allGenes.filter(
+        g => g.chromosome === gene.chromosome
+      );
+      chromosomeGenes.forEach(g => {
+        const biotype = g.biotype || 'Unknown';
+        biotypeCount[biotype] = (biotypeCount[biotype] || 0) + 1;
+      });
+    }
 
     // Convert to array, sort, and take top 6
     return Object.entries(biotypeCount)
@@ -38,7 +42,7 @@ export const BiotypeChart = React.memo(function BiotypeChart({ gene, allGenes }:
       }))
       .sort((a, b) => b.value - a.value)
       .slice(0, 6);
-  }, [gene, allGenes]);
+  }, [gene, allGenes, biotypeCounts]);
 
   const option = useMemo(() => {
     return {
@@ -1,4 +1,6 @@
 export interface Gene {
+  // Database id; only genes loaded from the backend API have one
+  id?: number;
   ensembl: string;
   geneSymbol: string | null;
   name: string | null;
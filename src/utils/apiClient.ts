@@ -18,6 +18,7 @@ const apiClient = axios.create({
 // API response types
 interface ApiGene {
   id: number;
+  assembly: string;
   ensembl: string;
   gene_symbol: string | null;
   name: string | null;
@@ -33,8 +34,46 @@ interface GeneStats {
   biotypes: string[];
 }
 
+export interface GeneFacets {
+  total_genes: number;
+  source: 'counters' | 'estimate' | 'exact';
+  facets: {
+    chromosome: Record<string, number>;
+    biotype: Record<string, number>;
+  };
+}
+
+interface ApiChromosomeSummary {
+  chromosome: string;
+  gene_count: number;
+  seq_region_start: number;
+  seq_region_end: number;
+  biotypes: Record<string, number>;
+}
+
+interface ApiGeneDetail {
+  gene: ApiGene;
+  upstream: ApiGene[];
+  downstream: ApiGene[];
+  chromosome: ApiChromosomeSummary;
+}
+
+export interface GeneDetail {
+  gene: Gene;
+  upstream: Gene[];
+  downstream: Gene[];
+  chromosome: {
+    chromosome: string;
+    geneCount: number;
+    seqRegionStart: number;
+    seqRegionEnd: number;
+    biotypes: Record<string, number>;
+  };
+}
+
 // Transform API response to match frontend Gene type
 const transformApiGene = (apiGene: ApiGene): Gene => ({
+  id: apiGene.id,
   ensembl: apiGene.ensembl,
   geneSymbol: apiGene.gene_symbol,
   name: apiGene.name,
@@ -73,6 +112,34 @@ export const geneApi = {
     }
   },
 
+  // Get a gene with its neighbors and chromosome context in one request
+  async getGeneDetail(id: number, flank = 5): Promise<GeneDetail> {
+    try {
+      const response = await apiClient.get<ApiGeneDetail>(
+        `/genes/${id}/detail`,
+        {
+          params: { flank },
+        }
+      );
+      const { gene, upstream, downstream, chromosome } = response.data;
+      return {
+        gene: transformApiGene(gene),
+        upstream: upstream.map(transformApiGene),
+        downstream: downstream.map(transformApiGene),
+        chromosome: {
+          chromosome: chromosome.chromosome,
+          geneCount: chromosome.gene_count,
+          seqRegionStart: chromosome.seq_region_start,
+          seqRegionEnd: chromosome.seq_region_end,
+          biotypes: chromosome.biotypes,
+        },
+      };
+    } catch (error) {
+      console.error(`Error fetching gene detail ${id}:`, error);
+      throw new Error(`Failed to fetch detail for gene with ID ${id}`);
+    }
+  },
+
   // Search genes by symbol
   async searchBySymbol(symbol: string, exact = false): Promise<Gene[]> {
     try {
@@ -128,6 +195,22 @@ export const geneApi = {
       throw new Error('Failed to fetch gene statistics');
     }
   },
+
+  // Get gene counts per chromosome and biotype for a listing's filters
+  async getGeneFacets(params?: {
+    chromosome?: string;
+    biotype?: string;
+  }): Promise<GeneFacets> {
+    try {
+      const response = await apiClient.get<GeneFacets>('/genes/stats/facets', {
+        params,
+      });
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching gene facets:', error);
+      throw new Error('Failed to fetch gene facets');
+    }
+  },
 };
 
 // Main function to load all gene data (equivalent to loadGeneData from csvParser)